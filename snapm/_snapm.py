@@ -56,6 +56,9 @@ _SIZE_SUFFIXES = {
     "Z": 2**70,
 }
 
+#: Display units for size_fmt(), indexed by power of 1024.
+_SIZE_FMT_UNITS = ["B", "KiB", "MiB", "GiB", "TiB", "PiB", "EiB", "ZiB", "YiB"]
+
 SECTOR_SIZE = 512
 
 ETC_FSTAB = "/etc/fstab"
@@ -479,14 +482,14 @@ def size_fmt(value):
     :param value: The integer value to format.
     :returns: A human readable string reflecting value.
     """
-    suffixes = ["B", "KiB", "MiB", "GiB", "TiB", "PiB", "EiB", "ZiB"]
     if value == 0:
         return "0B"
-    magnitude = int(math.floor(math.log(value, 1024)))
-    val = value / math.pow(1024, magnitude)
-    if magnitude > 7:
-        return f"{val:.1f}YiB"
-    return f"{val:3.1f}{suffixes[magnitude]}"
+    # Each unit is 2**10 times the last: the unit index follows directly
+    # from the bit length of the integer value.
+    magnitude = max(0, (int(value).bit_length() - 1) // 10)
+    magnitude = min(magnitude, len(_SIZE_FMT_UNITS) - 1)
+    val = value / (1 << (10 * magnitude))
+    return f"{val:3.1f}{_SIZE_FMT_UNITS[magnitude]}"
 
 
 def parse_size_with_units(value):
@@ -638,6 +641,66 @@ class SnapStatus(Enum):
         return "Invalid"
 
 
+def _device_id(path):
+    """
+    Return a ``(st_dev, st_ino)`` tuple identifying the file at ``path``.
+
+    :param path: The path to identify.
+    :returns: A tuple that compares equal for any two paths that refer to
+              the same file, in the same way as ``os.path.samefile()``.
+    """
+    st = os.stat(path)
+    return (st.st_dev, st.st_ino)
+
+
+def _build_mount_map():
+    """
+    Read /proc/mounts once and return a dictionary mapping the
+    ``_device_id()`` of each mounted device path to the first mount point
+    found for it.
+
+    :returns: A dictionary mapping device identities to mount point paths.
+    """
+    mount_map = {}
+    with open("/proc/mounts", "r", encoding="utf8") as mounts:
+        for line in mounts:
+            devpath, _, rest = line.partition(" ")
+            mount_point, _, _ = rest.partition(" ")
+            try:
+                mount_map.setdefault(_device_id(devpath), mount_point)
+            except (OSError, ValueError):
+                continue
+    return mount_map
+
+
+def _mounted_device_ids():
+    """
+    Return the set of device identifiers for currently mounted file systems.
+
+    :returns: A set of ``(st_dev, st_ino)`` tuples.
+    """
+    return set(_build_mount_map())
+
+
+def _any_snapshot_mounted(snapshots, device_ids=None):
+    """
+    Test whether any active snapshot in ``snapshots`` is currently mounted.
+
+    :param snapshots: An iterable of ``Snapshot`` objects to check.
+    :param device_ids: An optional set of mounted device identifiers
+                       returned by ``_mounted_device_ids()`` to use instead
+                       of reading ``/proc/mounts``.
+    :returns: ``True`` if any active snapshot is mounted or ``False``
+              otherwise.
+    """
+    active = [s for s in snapshots if s.status == SnapStatus.ACTIVE]
+    if not active:
+        return False
+    if device_ids is None:
+        device_ids = _mounted_device_ids()
+    return any(_device_id(s.devpath) in device_ids for s in active)
+
+
 class SnapshotSet:
     """
     Representation of a set of snapshots taken at the same point
@@ -661,6 +724,7 @@ class SnapshotSet:
         self.boot_entry = None
         self.revert_entry = None
         for snapshot in self._snapshots:
+            snapshot.snapshot_set = self
             if snapshot.mount_point:
                 self._by_mount_point[snapshot.mount_point] = snapshot
             self._by_origin[snapshot.origin] = snapshot
@@ -836,16 +900,47 @@ class SnapshotSet:
     def autoactivate(self, value):
         """
         Set the autoactivation status for all snapshots in this snapshot set.
+
+        :raises: ``SnapmPluginError`` if the autoactivation status could not
+                 be set for one or more snapshots.
+        """
+        self.set_autoactivate(auto=value)
+
+    def set_autoactivate(self, auto=False):
+        """
+        Set the autoactivation status for all snapshots in this snapshot set.
+
+        Snapshots whose provider reports, from cached state, that they
+        already have the requested status are left unchanged. An attempt is
+        made to update every other snapshot in the set even if an earlier
+        member fails.
+
+        :param auto: ``True`` to enable autoactivation or ``False`` otherwise.
+        :returns: ``True`` if any snapshot was updated or ``False`` otherwise.
+        :raises: ``SnapmPluginError`` if the autoactivation status could not
+                 be set for one or more snapshots.
         """
+        changed = False
+        failed = False
         for snapshot in self.snapshots:
+            if snapshot.cached_autoactivate == auto:
+                continue
             try:
-                snapshot.set_autoactivate(auto=value)
+                snapshot.set_autoactivate(auto=auto)
+                changed = True
             except SnapmError as err:
                 _log_error(
                     "Failed to set autoactivation for snapshot set member %s: %s",
                     snapshot.name,
                     err,
                 )
+                failed = True
+        if failed:
+            raise SnapmPluginError(
+                "Could not set autoactivation for all snapshots in snapshot "
+                f"set {self.name}"
+            )
+        return changed
 
     @property
     def origin_mounted(self):
@@ -869,7 +964,7 @@ class SnapshotSet:
                   ``SnapshotSet`` are currently mounted, or ``False``
                   otherwise.
         """
-        return any(s.snapshot_mounted for s in self.snapshots)
+        return _any_snapshot_mounted(self.snapshots)
 
     @property
     def mounted(self):
@@ -1116,6 +1211,15 @@ class Snapshot:
         """
         raise NotImplementedError
 
+    @property
+    def cached_autoactivate(self):
+        """
+        The autoactivation status of this snapshot if the provider can
+        report it without querying the storage layer, or ``None`` if it
+        cannot.
+        """
+        return None
+
     @property
     def origin_mounted(self):
         """
@@ -1143,14 +1247,7 @@ class Snapshot:
         """
         if self.status != SnapStatus.ACTIVE:
             return False
-        with open("/proc/mounts", "r", encoding="utf8") as mounts:
-            for line in mounts:
-                fields = line.split(" ")
-                devpath = fields[0]
-                if os.path.exists(devpath):
-                    if os.path.samefile(self.devpath, devpath):
-                        return True
-        return False
+        return _device_id(self.devpath) in _mounted_device_ids()
 
     @property
     def mounted(self):
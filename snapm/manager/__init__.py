@@ -15,5 +15,19 @@
 Top level interface to the snapshot manager.
 """
 
-from ._manager import *  # noqa: F401, F403
-from ._manager import __all__  # noqa: F401
+__all__ = ["Plugin", "Manager"]
+
+
+def __getattr__(name):
+    """
+    Import ``Manager`` and ``Plugin`` from ``snapm.manager._manager`` on
+    first access so that importing a submodule (``boot``, ``plugins``)
+    does not pay for the full manager import.
+    """
+    if name in __all__:
+        from . import _manager  # pylint: disable=import-outside-toplevel
+
+        value = getattr(_manager, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
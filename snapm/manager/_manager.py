@@ -14,16 +14,18 @@
 """
 Manager interface and plugin infrastructure.
 """
-from subprocess import run, CalledProcessError
+from subprocess import run, CalledProcessError, DEVNULL, PIPE
+from collections import defaultdict
 import logging
 from time import time
 from math import floor
-from stat import S_ISBLK
-from os import stat
-from os.path import exists, ismount, normpath, samefile
+from stat import S_ISBLK, S_ISLNK
+from os import lstat, stat
+from os.path import normpath
 import fnmatch
 import inspect
 import os
+import re
 
 import snapm.manager.plugins
 from snapm.manager.boot import (
@@ -32,6 +34,7 @@ from snapm.manager.boot import (
     delete_snapset_boot_entry,
     create_snapset_revert_entry,
     delete_snapset_revert_entry,
+    deferred_cache_clean,
     check_boom_config,
 )
 
@@ -55,6 +58,12 @@ from snapm import (
     SnapshotSet,
     Snapshot,
 )
+from snapm._snapm import (
+    _any_snapshot_mounted,
+    _build_mount_map,
+    _device_id,
+    _mounted_device_ids,
+)
 
 
 _log = logging.getLogger(__name__)
@@ -68,19 +77,31 @@ _log_error = _log.error
 
 JOURNALCTL_CMD = "journalctl"
 
+#: Path to the persistent systemd journal.
+_JOURNAL_DIR = "/var/log/journal"
+
+#: Characters that may not appear in a snapshot set name.
+_INVALID_NAME_RE = re.compile(r"[/\\_ ]")
+
+#: Plugin file names must begin with an ASCII letter.
+_PLUGIN_FILE_RE = re.compile(r"^[A-Za-z]")
+
+#: Set once ``load_plugins()`` has imported the available plugin modules.
+_PLUGINS_LOADED = False
+
 
 class PluginRegistry(type):
     """
     Metaclass for Plugin classes.
     """
 
-    plugins = []
+    plugins = {}
 
     def __init__(cls, name, _bases, _attrs):
         super().__init__(name, _bases, _attrs)
         if name != "Plugin" and not name.startswith("_"):
             _log_debug("Loaded plugin %s version: %s", cls.name, cls.version)
-            PluginRegistry.plugins.append(cls)
+            PluginRegistry.plugins[name] = cls
 
 
 class Plugin(metaclass=PluginRegistry):
@@ -100,25 +121,29 @@ class Plugin(metaclass=PluginRegistry):
         """
         Log at error level.
         """
-        self.logger.error(*args)
+        if self.logger.isEnabledFor(logging.ERROR):
+            self.logger.error(*args)
 
     def _log_warn(self, *args):
         """
         Log at warning level.
         """
-        self.logger.warning(*args)
+        if self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning(*args)
 
     def _log_info(self, *args):
         """
         Log at info level.
         """
-        self.logger.info(*args)
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(*args)
 
     def _log_debug(self, *args):
         """
         Log at debug level.
         """
-        self.logger.debug(*args)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(*args)
 
     def info(self):
         """
@@ -147,12 +172,14 @@ class Plugin(metaclass=PluginRegistry):
         """
         raise NotImplementedError
 
-    def can_snapshot(self, source):
+    def can_snapshot(self, source, st=None):
         """
         Test whether this plugin can snapshot the specified mount point or
         block device.
 
         :param source: The block device or mount point path to test.
+        :param st: An optional ``os.stat_result`` for ``source``. If given
+                   it is used in place of calling ``stat()`` again.
         :returns: ``True`` if this plugin can snapshot the file system mounted
                   at ``mount_point``, or ``False`` otherwise.
         """
@@ -261,6 +288,19 @@ class Plugin(metaclass=PluginRegistry):
         """
         raise NotImplementedError
 
+    def delete_snapshots(self, names):
+        """
+        Delete the snapshots named in ``names``.
+
+        The default implementation calls ``delete_snapshot()`` for each
+        name in turn. Plugins that are able to remove several snapshots
+        with a single operation may override this method.
+
+        :param names: A list of the names of the snapshots to be removed.
+        """
+        for name in names:
+            self.delete_snapshot(name)
+
     def activate_snapshot(self, name):
         """
         Activate the snapshot named ``name``
@@ -269,6 +309,19 @@ class Plugin(metaclass=PluginRegistry):
         """
         raise NotImplementedError
 
+    def activate_snapshots(self, names):
+        """
+        Activate the snapshots named in ``names``.
+
+        The default implementation calls ``activate_snapshot()`` for each
+        name in turn. Plugins that are able to activate several snapshots
+        with a single operation may override this method.
+
+        :param names: A list of the names of the snapshots to be activated.
+        """
+        for name in names:
+            self.activate_snapshot(name)
+
     def deactivate_snapshot(self, name):
         """
         Deactivate the snapshot named ``name``
@@ -277,12 +330,26 @@ class Plugin(metaclass=PluginRegistry):
         """
         raise NotImplementedError
 
+    def deactivate_snapshots(self, names):
+        """
+        Deactivate the snapshots named in ``names``.
+
+        The default implementation calls ``deactivate_snapshot()`` for each
+        name in turn. Plugins that are able to deactivate several snapshots
+        with a single operation may override this method.
+
+        :param names: A list of the names of the snapshots to be deactivated.
+        """
+        for name in names:
+            self.deactivate_snapshot(name)
+
     def set_autoactivate(self, name, auto=False):
         """
         Set the autoactivation state of the snapshot named ``name``.
 
         :param name: The name of the snapshot to be modified.
         :param auto: ``True`` to enable autoactivation or ``False`` otherwise.
+        :raises: ``SnapmError`` if the autoactivation state could not be set.
         """
         raise NotImplementedError
 
@@ -307,15 +374,21 @@ def find(file_pattern, top_dir, max_depth=None, path_pattern=None):
         base_depth = os.path.dirname(top_dir).count(os.path.sep)
         max_depth += base_depth
 
+    file_match = re.compile(fnmatch.translate(file_pattern)).match
+    path_match = (
+        re.compile(fnmatch.translate(path_pattern)).match if path_pattern else None
+    )
+
     for path, dirlist, filelist in os.walk(top_dir):
         if max_depth and path.count(os.path.sep) >= max_depth:
             del dirlist[:]
 
-        if path_pattern and not fnmatch.fnmatch(path, path_pattern):
+        if path_match and not path_match(path):
             continue
 
-        for name in fnmatch.filter(filelist, file_pattern):
-            yield os.path.join(path, name)
+        for name in filelist:
+            if file_match(name):
+                yield os.path.join(path, name)
 
 
 def _plugin_name(path):
@@ -342,6 +415,27 @@ def _get_plugins_from_list(pluglist):
     return plugins
 
 
+def _scan_plugin_dir(path):
+    """
+    Return the names of candidate plugin files in ``path``.
+
+    Plugin modules live directly in the plugin package directory, so
+    only the top level of ``path`` is scanned. Names must begin with an
+    ASCII letter and end in ``.py``.
+
+    :param path: The directory to scan.
+    :returns: A list of file names.
+    """
+    with os.scandir(path) as entries:
+        return [
+            entry.name
+            for entry in entries
+            if entry.name.endswith(".py")
+            and _PLUGIN_FILE_RE.match(entry.name)
+            and entry.is_file(follow_symlinks=False)
+        ]
+
+
 def _find_plugins_in_dir(path):
     """
     Find possible plugin files in ``path``.
@@ -350,7 +444,7 @@ def _find_plugins_in_dir(path):
     """
     _log_debug_manager("Finding plugins in %s", path)
     if os.path.exists(path):
-        py_files = list(find("[a-zA-Z]*.py", path))
+        py_files = _scan_plugin_dir(path)
         pnames = _get_plugins_from_list(py_files)
         _log_debug_manager("Found plugin modules: %s", ", ".join(pnames))
         if pnames:
@@ -433,7 +527,13 @@ def import_plugin(name, superclasses=None):
 def load_plugins():
     """
     Attempt to load plugin modules.
+
+    Plugin modules are only searched for and imported on the first call:
+    subsequent calls return immediately.
     """
+    global _PLUGINS_LOADED  # pylint: disable=global-statement
+    if _PLUGINS_LOADED:
+        return
     helper = ImporterHelper(snapm.manager.plugins)
     plugins = helper.get_modules()
     _log_debug(
@@ -443,6 +543,7 @@ def load_plugins():
         plugbase, _ = os.path.splitext(plug)
         if not plugbase.startswith("_"):
             import_plugin(plugbase)
+    _PLUGINS_LOADED = True
 
 
 def select_snapshot_set(select, snapshot_set):
@@ -468,9 +569,7 @@ def select_snapshot_set(select, snapshot_set):
     if select.nr_snapshots and select.nr_snapshots != snapshot_set.nr_snapshots:
         return False
     if select.mount_points:
-        s_mount_points = sorted(select.mount_points)
-        mount_points = sorted(snapshot_set.mount_points)
-        if s_mount_points != mount_points:
+        if frozenset(select.mount_points) != frozenset(snapshot_set.mount_points):
             return False
 
     return True
@@ -500,29 +599,83 @@ def select_snapshot(select, snapshot):
     return True
 
 
+def _snapshots_by_provider(snapshots):
+    """
+    Group ``snapshots`` by the plugin that provides them.
+
+    :param snapshots: An iterable of ``Snapshot`` objects.
+    :returns: A dictionary mapping each provider plugin to a list of its
+              snapshots, in their original order.
+    """
+    by_provider = {}
+    for snapshot in snapshots:
+        by_provider.setdefault(snapshot.provider, []).append(snapshot)
+    return by_provider
+
+
+def _journalctl(*actions):
+    """
+    Run ``journalctl`` once for each action in ``actions``.
+
+    ``journalctl`` only honours the last action given on a command line so
+    actions cannot be combined into a single invocation.
+
+    :param actions: The ``journalctl`` action options to run, in order.
+    :raises: ``SnapmCalloutError`` if a ``journalctl`` command fails.
+    """
+    for action in actions:
+        try:
+            run(
+                [JOURNALCTL_CMD, action],
+                check=True,
+                stdin=DEVNULL,
+                stdout=DEVNULL,
+                stderr=PIPE,
+                encoding="utf8",
+            )
+        except CalledProcessError as err:  # pragma: no cover
+            detail = f" ({err.stderr.strip()})" if err.stderr else ""
+            raise SnapmCalloutError(
+                f"Error calling journalctl to flush journal: {err}{detail}"
+            ) from err
+
+
 def _suspend_journal():
     """
     Suspend journal writes to /var before creating snapshots.
     """
-    try:
-        run([JOURNALCTL_CMD, "--flush"], check=True)
-        run([JOURNALCTL_CMD, "--relinquish-var"], check=True)
-    except CalledProcessError as err:  # pragma: no cover
-        raise SnapmCalloutError(
-            f"Error calling journalctl to flush journal: {err}"
-        ) from err
+    _journalctl("--flush", "--relinquish-var")
 
 
 def _resume_journal():
     """
     Resume journal writes to /var after creating snapshots.
     """
-    try:
-        run([JOURNALCTL_CMD, "--flush"], check=True)
-    except CalledProcessError as err:  # pragma: no cover
-        raise SnapmCalloutError(
-            f"Error calling journalctl to flush journal: {err}"
-        ) from err
+    _journalctl("--flush")
+
+
+def _journal_in_mounts(mount_points):
+    """
+    Test whether the persistent journal directory lives on any of the file
+    systems mounted at ``mount_points``.
+
+    :param mount_points: An iterable of mount point paths. Empty strings
+                         (block device sources that are not mounted) are
+                         ignored.
+    :returns: ``True`` if a mount point contains the journal directory, or
+              a file system mounted within it, or ``False`` otherwise.
+    """
+    for mount_point in mount_points:
+        if not mount_point:
+            continue
+        if mount_point in ("/", _JOURNAL_DIR):
+            return True
+        # A file system mounted above or below the journal directory.
+        if _JOURNAL_DIR.startswith(mount_point + "/"):
+            return True
+        if mount_point.startswith(_JOURNAL_DIR + "/"):
+            return True
+    return False
 
 
 def _parse_source_specs(source_specs, default_size_policy):
@@ -594,31 +747,60 @@ def _check_revert_snapshot_set(snapset):
             raise err
 
 
+#: Error messages for snapshot set states that do not permit operations.
+_INVALID_STATUS_MSGS = {
+    SnapStatus.INVALID: "Cannot operate on invalid snapshot set '%s'",
+    SnapStatus.REVERTING: "Cannot operate on reverting snapshot set '%s'",
+}
+
+
 def _check_snapset_status(snapset, operation):
     """
     Check that a snapshot set status is not ``SnapStatus.INVALID`` or
     ``SnapStatus.REVERTING`` before carrying out ``operation``.
     """
-    if snapset.status in (SnapStatus.INVALID, SnapStatus.REVERTING):
-        if snapset.status == SnapStatus.INVALID:
-            _log_error("Cannot operate on invalid snapshot set '%s'", snapset.name)
-        if snapset.status == SnapStatus.REVERTING:
-            _log_error("Cannot operate on reverting snapshot set '%s'", snapset.name)
+    msg = _INVALID_STATUS_MSGS.get(snapset.status)
+    if msg is not None:
+        _log_error(msg, snapset.name)
         raise SnapmStateError(f"Failed to {operation} snapset '{snapset.name}'")
 
 
-def _find_mount_point_for_devpath(devpath):
+def _is_mount_point(path, st):
+    """
+    Test whether ``path`` is a mount point.
+
+    Equivalent to ``os.path.ismount()`` but reuses the ``lstat()`` result
+    ``st`` for ``path`` so that only the parent directory must be examined.
+
+    :param path: The path to test.
+    :param st: The ``os.stat_result`` returned by ``lstat(path)``.
+    :returns: ``True`` if ``path`` is a mount point or ``False`` otherwise.
+    """
+    if S_ISLNK(st.st_mode):
+        return False
+    try:
+        parent = lstat(os.path.join(path, ".."))
+    except OSError:
+        return False
+    return st.st_dev != parent.st_dev or st.st_ino == parent.st_ino
+
+
+def _find_mount_point_for_devpath(devpath, mount_map=None, st=None):
     """
     Return the first mount point found in /proc/mounts that corresponds to
-    ``device``, or the empty string if no mount point can be found.
+    ``devpath``, or the empty string if no mount point can be found.
+
+    :param devpath: The device path to look up.
+    :param mount_map: An optional mount map returned by ``_build_mount_map()``
+                      to use instead of reading /proc/mounts.
+    :param st: An optional ``os.stat_result`` for ``devpath`` to use instead
+               of calling ``stat()`` again.
+    :returns: The mount point path or the empty string.
     """
-    with open("/proc/mounts", "r", encoding="utf8") as mounts:
-        for line in mounts:
-            fields = line.split(" ")
-            if exists(fields[0]):
-                if samefile(devpath, fields[0]):
-                    return fields[1]
-    return ""
+    if mount_map is None:
+        mount_map = _build_mount_map()
+    device_id = (st.st_dev, st.st_ino) if st is not None else _device_id(devpath)
+    return mount_map.get(device_id, "")
 
 
 class Manager:
@@ -627,19 +809,18 @@ class Manager:
     """
 
     plugins = []
-    snapshot_sets = []
     by_name = {}
     by_uuid = {}
 
     def __init__(self):
         self.plugins = []
-        self.snapshot_sets = []
         self.by_name = {}
         self.by_uuid = {}
+        self._snapshot_sets = None
         check_boom_config()
         self._boot_cache = BootCache()
         load_plugins()
-        for plugin_class in PluginRegistry.plugins:
+        for plugin_class in PluginRegistry.plugins.values():
             try:
                 plugin = plugin_class(_log)
                 self.plugins.append(plugin)
@@ -653,21 +834,74 @@ class Manager:
                 _log_error("Disabling plugin %s: %s", plugin_class.__name__, err)
         self.discover_snapshot_sets()
 
-    def _find_and_verify_plugins(
-        self, sources, size_policies, _requested_provider=None
-    ):
+    @property
+    def snapshot_sets(self):
+        """
+        The list of snapshot sets known to this ``Manager``, sorted by
+        name. The sorted list is built on first use after discovery and is
+        then kept in order as snapshot sets are added or removed.
+        """
+        if self._snapshot_sets is None:
+            self._snapshot_sets = sorted(self.by_name.values(), key=lambda ss: ss.name)
+        return self._snapshot_sets
+
+    def _add_snapshot_set(self, snapset):
+        """
+        Add ``snapset`` to the name and UUID indexes.
+
+        :param snapset: The ``SnapshotSet`` to add.
+        """
+        if snapset.name in self.by_name:
+            self._snapshot_sets = None
+        elif self._snapshot_sets is not None:
+            # Binary search for the insertion point to keep the cached list
+            # sorted by name without re-sorting it.
+            (low, high) = (0, len(self._snapshot_sets))
+            while low < high:
+                mid = (low + high) // 2
+                if self._snapshot_sets[mid].name < snapset.name:
+                    low = mid + 1
+                else:
+                    high = mid
+            self._snapshot_sets.insert(low, snapset)
+        self.by_name[snapset.name] = snapset
+        self.by_uuid[snapset.uuid] = snapset
+
+    def _remove_snapshot_set(self, snapset):
+        """
+        Remove ``snapset`` from the name and UUID indexes.
+
+        :param snapset: The ``SnapshotSet`` to remove.
+        """
+        self.by_name.pop(snapset.name)
+        self.by_uuid.pop(snapset.uuid)
+        if self._snapshot_sets is not None:
+            self._snapshot_sets.remove(snapset)
+
+    def _find_and_verify_plugins(self, sources, size_policies, requested_provider=None):
         """
         Find snapshot provider plugins for each source in ``sources``
         and verify that a provider exists for each source present.
 
         :param sources: A list of source mount point or block device paths.
         :param size_policies: A dictionary mapping sources to size policies.
-        :returns: A dictionary mapping sources to plugins.
-        """
-        # Initialise provider mapping.
-        provider_map = {k: None for k in sources}
+        :param requested_provider: The name of a plugin to probe before the
+                                   others, or ``None`` to use plugin order.
+        :returns: A tuple ``(provider_map, stats)`` of dictionaries mapping
+                  sources to plugins and to the ``os.stat_result`` for each
+                  source respectively.
+        """
+        provider_map = {}
+        stats = {}
+
+        plugins = self.plugins
+        if requested_provider is not None:
+            # Probe the requested provider first: sorted() is stable.
+            plugins = sorted(
+                plugins, key=lambda plugin: plugin.name != requested_provider
+            )
 
-        # Find provider plugins for sources
+        # Find a provider plugin for each source
         for source in sources:
             _log_debug(
                 "Probing plugins for %s with size policy %s",
@@ -675,22 +909,26 @@ class Manager:
                 size_policies[source],
             )
 
-            if not ismount(source) and not S_ISBLK(stat(source).st_mode):
+            try:
+                lst = lstat(source)
+                st = stat(source) if S_ISLNK(lst.st_mode) else lst
+            except FileNotFoundError as err:
+                raise SnapmPathError(f"Path '{source}' does not exist") from err
+            stats[source] = st
+            if not S_ISBLK(st.st_mode) and not _is_mount_point(source, lst):
                 raise SnapmPathError(
                     f"Path '{source}' is not a block device or mount point"
                 )
 
-            for plugin in self.plugins:
-                if plugin.can_snapshot(source):
+            for plugin in plugins:
+                if plugin.can_snapshot(source, st=st):
                     provider_map[source] = plugin
-
-        # Verify each mount point has a provider plugin
-        for source in provider_map:
-            if provider_map[source] is None:
+                    break
+            else:
                 raise SnapmNoProviderError(
                     f"Could not find snapshot provider for {source}"
                 )
-        return provider_map
+        return (provider_map, stats)
 
     def _snapset_from_name_or_uuid(self, name=None, uuid=None):
         """
@@ -706,24 +944,26 @@ class Manager:
                  match.
         """
         if name is not None:
-            if name not in self.by_name:
-                raise SnapmNotFoundError(f"Could not find snapshot set named {name}")
-            snapset = self.by_name[name]
+            try:
+                snapset = self.by_name[name]
+            except KeyError as err:
+                raise SnapmNotFoundError(
+                    f"Could not find snapshot set named {name}"
+                ) from err
+            if uuid is not None and snapset.uuid != uuid:
+                raise SnapmInvalidIdentifierError(
+                    f"Conflicting name and UUID: {str(uuid)} does not match '{name}'"
+                )
         elif uuid is not None:
-            if uuid not in self.by_uuid:
+            try:
+                snapset = self.by_uuid[uuid]
+            except KeyError as err:
                 raise SnapmNotFoundError(
                     f"Could not find snapshot set with uuid {uuid}"
-                )
-            snapset = self.by_uuid[uuid]
+                ) from err
         else:
             raise SnapmNotFoundError("A snapshot set name or UUID is required")
 
-        if name and uuid:
-            if self.by_name[name] != self.by_uuid[uuid]:
-                raise SnapmInvalidIdentifierError(
-                    f"Conflicting name and UUID: {str(uuid)} does not match '{name}'"
-                )
-
         return snapset
 
     def _check_recursion(self, origins):
@@ -734,11 +974,11 @@ class Manager:
         :param origins: A list of origin devices to check.
         :raises: ``SnapmRecursionError`` if an origin device is a snapshot.
         """
-        snapshot_devices = [
+        snapshot_devices = {
             snapshot.devpath
             for snapset in self.snapshot_sets
             for snapshot in snapset.snapshots
-        ]
+        }
         for source, device in origins.items():
             if device in snapshot_devices:
                 raise SnapmRecursionError(
@@ -755,53 +995,60 @@ class Manager:
         Initialises the ``snapshot_sets``, ``by_name`` and ``by_uuid`` members
         with the discovered snapshot sets.
         """
-        self.snapshot_sets = []
         self.by_name = {}
         self.by_uuid = {}
+        self._snapshot_sets = None
         snapshots = []
-        snapset_names = set()
         self._boot_cache.refresh_cache()
         _log_debug("Discovering snapshot sets for %s plugins", len(self.plugins))
         for plugin in self.plugins:
             snapshots.extend(plugin.discover_snapshots())
         _log_debug("Discovered %s managed snapshots", len(snapshots))
+
+        # Group snapshots by snapshot set name in a single pass.
+        by_snapset_name = defaultdict(list)
         for snapshot in snapshots:
-            snapset_names.add(snapshot.snapset_name)
-        for snapset_name in snapset_names:
-            set_snapshots = [
-                snap for snap in snapshots if snap.snapset_name == snapset_name
-            ]
+            by_snapset_name[snapshot.snapset_name].append(snapshot)
+
+        for snapset_name, set_snapshots in by_snapset_name.items():
             set_timestamp = set_snapshots[0].timestamp
             for snap in set_snapshots:
                 if snap.timestamp != set_timestamp:
                     _log_warn(
                         "Snapshot set '%s' has inconsistent timestamps", snapset_name
                     )
-                    continue
+                    break
 
             snapset = SnapshotSet(snapset_name, set_timestamp, set_snapshots)
 
-            # Associate snapset with boot entry if present
-            if snapset.name in self._boot_cache.entry_cache:
-                snapset.boot_entry = self._boot_cache.entry_cache[snapset.name]
-            elif str(snapset.uuid) in self._boot_cache.entry_cache:
-                snapset.boot_entry = self._boot_cache.entry_cache[str(snapset.uuid)]
-
-            # Associate snapset with revert entry if present
-            if snapset.name in self._boot_cache.revert_cache:
-                snapset.revert_entry = self._boot_cache.revert_cache[snapset.name]
-            elif str(snapset.uuid) in self._boot_cache.revert_cache:
-                snapset.revert_entry = self._boot_cache.revert_cache[str(snapset.uuid)]
-
-            self.snapshot_sets.append(snapset)
-            self.by_name[snapset.name] = snapset
-            self.by_uuid[snapset.uuid] = snapset
-            for snapshot in snapset.snapshots:
-                snapshot.snapshot_set = snapset
+            # Associate snapset with boot and revert entries if present
+            (snapset.boot_entry, snapset.revert_entry) = self._boot_cache.entry_for(
+                snapset
+            )
+
+            self._add_snapshot_set(snapset)
 
-        self.snapshot_sets.sort(key=lambda ss: ss.name)
         _log_debug("Discovered %d snapshot sets", len(self.snapshot_sets))
 
+    def _candidate_snapshot_sets(self, selection):
+        """
+        Return the snapshot sets that may match ``selection``.
+
+        If the selection specifies a snapshot set name or UUID the
+        candidate set is looked up directly in the ``by_name`` or
+        ``by_uuid`` index. Otherwise all snapshot sets are candidates.
+
+        :param selection: Selection criteria to apply.
+        :returns: A list of ``SnapshotSet`` objects.
+        """
+        if selection.name:
+            snapset = self.by_name.get(selection.name)
+        elif selection.uuid:
+            snapset = self.by_uuid.get(selection.uuid)
+        else:
+            return self.snapshot_sets
+        return [snapset] if snapset is not None else []
+
     def find_snapshot_sets(self, selection=None):
         """
         Find snapshot sets matching selection criteria.
@@ -818,7 +1065,7 @@ class Manager:
 
         _log_debug("Finding snapshot sets for %s", repr(selection))
 
-        for snapset in self.snapshot_sets:
+        for snapset in self._candidate_snapshot_sets(selection):
             if select_snapshot_set(selection, snapset):
                 matches.append(snapset)
 
@@ -841,7 +1088,7 @@ class Manager:
 
         _log_debug("Finding snapshots for %s", repr(selection))
 
-        for snapset in self.snapshot_sets:
+        for snapset in self._candidate_snapshot_sets(selection):
             for snapshot in snapset.snapshots:
                 if select_snapshot(selection, snapshot):
                     matches.append(snapshot)
@@ -860,14 +1107,13 @@ class Manager:
         :raises: ``SnapmExistsError`` if the name is already in use, or
                  ``SnapmInvalidIdentifierError`` if the name fails validation.
         """
-        invalid_chars = ["/", "\\", "_", " "]
         if name in self.by_name:
             raise SnapmExistsError(f"Snapshot set named '{name}' already exists")
-        for char in invalid_chars:
-            if char in name:
-                raise SnapmInvalidIdentifierError(
-                    f"Snapshot set name cannot include '{char}'"
-                )
+        match = _INVALID_NAME_RE.search(name)
+        if match:
+            raise SnapmInvalidIdentifierError(
+                f"Snapshot set name cannot include '{match.group(0)}'"
+            )
 
     # pylint: disable=too-many-branches,too-many-locals
     def create_snapshot_set(self, name, source_specs, default_size_policy=None):
@@ -890,18 +1136,26 @@ class Manager:
         )
 
         # Initialise provider mapping.
-        provider_map = self._find_and_verify_plugins(sources, size_policies, None)
+        (provider_map, stats) = self._find_and_verify_plugins(
+            sources, size_policies, None
+        )
+        # Unique providers in source order.
+        providers = list(dict.fromkeys(provider_map.values()))
 
-        for provider in set(provider_map.values()):
+        for provider in providers:
             provider.start_transaction()
 
         timestamp = floor(time())
         origins = {}
         mounts = {}
-
-        for source in provider_map:
-            if S_ISBLK(stat(source).st_mode):
-                mounts[source] = _find_mount_point_for_devpath(source)
+        mount_map = None
+
+        for source, provider in provider_map.items():
+            st = stats[source]
+            if S_ISBLK(st.st_mode):
+                if mount_map is None:
+                    mount_map = _build_mount_map()
+                mounts[source] = _find_mount_point_for_devpath(source, mount_map, st=st)
                 origins[source] = source
                 mount = mounts[source]
                 if mount in provider_map:
@@ -910,63 +1164,62 @@ class Manager:
                     )
             else:
                 mount = source
-                origins[source] = provider_map[source].origin_from_mount_point(mount)
+                origins[source] = provider.origin_from_mount_point(mount)
 
             try:
-                provider_map[source].check_create_snapshot(
+                provider.check_create_snapshot(
                     origins[source], name, timestamp, mount, size_policies[source]
                 )
             except SnapmInvalidIdentifierError as err:
-                _log_error(
-                    "Error creating %s snapshot: %s", provider_map[source].name, err
-                )
+                _log_error("Error creating %s snapshot: %s", provider.name, err)
                 raise SnapmInvalidIdentifierError(
                     f"Snapset name {name} too long"
                 ) from err
             except SnapmNoSpaceError as err:
-                _log_error(
-                    "Error creating %s snapshot: %s", provider_map[source].name, err
-                )
+                _log_error("Error creating %s snapshot: %s", provider.name, err)
                 raise SnapmNoSpaceError(
                     f"Insufficient free space for snapshot set {name}"
                 ) from err
 
         self._check_recursion(origins)
 
-        _suspend_journal()
+        # Only suspend journal writes if a snapshot covers the journal.
+        suspend_journal = _journal_in_mounts(
+            mounts.get(source, source) for source in provider_map
+        )
+        if suspend_journal:
+            _suspend_journal()
 
         snapshots = []
         for source in provider_map:
-            if S_ISBLK(stat(source).st_mode):
-                mount = mounts[source]
-            else:
-                mount = source
             try:
                 snapshots.append(
                     provider_map[source].create_snapshot(
-                        origins[source], name, timestamp, mount, size_policies[source]
+                        origins[source],
+                        name,
+                        timestamp,
+                        mounts.get(source, source),
+                        size_policies[source],
                     )
                 )
             except SnapmError as err:
                 _log_error("Error creating snapshot set member %s: %s", name, err)
-                _resume_journal()
+                if suspend_journal:
+                    _resume_journal()
                 for snapshot in snapshots:
                     snapshot.delete()
                 raise SnapmPluginError(
                     f"Could not create all snapshots for set {name}"
                 ) from err
 
-        _resume_journal()
+        if suspend_journal:
+            _resume_journal()
 
-        for provider in set(provider_map.values()):
+        for provider in providers:
             provider.end_transaction()
 
         snapset = SnapshotSet(name, timestamp, snapshots)
-        for snapshot in snapset.snapshots:
-            snapshot.snapshot_set = snapset
-        self.by_name[snapset.name] = snapset
-        self.by_uuid[snapset.uuid] = snapset
-        self.snapshot_sets.append(snapset)
+        self._add_snapshot_set(snapset)
         return snapset
 
     def rename_snapshot_set(self, old_name, new_name):
@@ -991,9 +1244,7 @@ class Manager:
         new_snapshots = []
 
         # Remove references to old set
-        self.snapshot_sets.remove(snapset)
-        self.by_name.pop(snapset.name)
-        self.by_uuid.pop(snapset.uuid)
+        self._remove_snapshot_set(snapset)
 
         for snapshot in snapshots.copy():
             snapshots.remove(snapshot)
@@ -1016,21 +1267,104 @@ class Manager:
                 old_snapset = SnapshotSet(
                     old_name, timestamp, snapshots + rollback_snapshots
                 )
-                self.by_name[old_snapset.name] = old_snapset
-                self.by_uuid[old_snapset.uuid] = old_snapset
-                self.snapshot_sets.append(old_snapset)
+                self._add_snapshot_set(old_snapset)
                 raise SnapmPluginError(
                     f"Could not rename all snapshots for set {old_name}"
                 ) from err
 
         new_snapset = SnapshotSet(new_name, timestamp, new_snapshots)
-        for snapshot in new_snapset.snapshots:
-            snapshot.snapshot_set = new_snapset
-        self.by_name[new_snapset.name] = new_snapset
-        self.by_uuid[new_snapset.uuid] = new_snapset
-        self.snapshot_sets.append(new_snapset)
+        self._add_snapshot_set(new_snapset)
         return new_snapset
 
+    @staticmethod
+    def _check_deletable(sets):
+        """
+        Check that every snapshot set in ``sets`` can be deleted before any
+        of them are modified.
+
+        Mounted snapshots are reported in preference to an in-progress
+        revert, as they were when each set was checked as it was deleted.
+
+        :param sets: A list of ``SnapshotSet`` objects to check.
+        :raises: ``SnapmBusyError`` naming every set that has mounted
+                 snapshots or, failing that, every set that is being
+                 reverted.
+        """
+        device_ids = _mounted_device_ids()
+        mounted = [
+            snapset.name
+            for snapset in sets
+            if _any_snapshot_mounted(snapset.snapshots, device_ids)
+        ]
+        if mounted:
+            noun = "snapshot sets" if len(mounted) > 1 else "snapshot set"
+            raise SnapmBusyError(
+                f"Snapshots from {noun} {', '.join(mounted)} are mounted: cannot delete"
+            )
+        reverting = [
+            snapset.name for snapset in sets if snapset.status == SnapStatus.REVERTING
+        ]
+        if reverting:
+            noun = "snapshot sets" if len(reverting) > 1 else "snapshot set"
+            _log_error("Cannot operate on reverting %s %s", noun, ", ".join(reverting))
+            raise SnapmBusyError(f"Failed to delete {noun} {', '.join(reverting)}")
+
+    @staticmethod
+    def _prune_deleted_snapshots(snapset, provider, snapshots):
+        """
+        Remove the members of ``snapshots`` that no longer exist from
+        ``snapset`` following a failed delete.
+
+        :param snapset: The ``SnapshotSet`` being deleted.
+        :param provider: The plugin that failed to delete ``snapshots``.
+        :param snapshots: The ``Snapshot`` objects passed to the failed
+                          ``delete_snapshots()`` call.
+        """
+        try:
+            present = {snapshot.name for snapshot in provider.discover_snapshots()}
+        except SnapmError as err:
+            _log_error("Failed to re-discover %s snapshots: %s", provider.name, err)
+            return
+        for snapshot in snapshots:
+            if snapshot.name not in present:
+                _log_debug("Removing deleted snapshot %s from set", snapshot.name)
+                snapset.snapshots.remove(snapshot)
+
+    def _delete_snapshot_set(self, snapset):
+        """
+        Delete ``snapset`` and remove it from this ``Manager``.
+
+        The caller must have checked that ``snapset`` is not in use with
+        ``_check_deletable()``.
+
+        :param snapset: The ``SnapshotSet`` to delete.
+        """
+        delete_snapset_boot_entry(snapset)
+        delete_snapset_revert_entry(snapset)
+
+        # Delete the snapshots belonging to each provider in one call.
+        by_provider = _snapshots_by_provider(snapset.snapshots)
+        for provider, snapshots in by_provider.items():
+            names = [snapshot.name for snapshot in snapshots]
+            try:
+                provider.delete_snapshots(names)
+            except SnapmError as err:
+                _log_error(
+                    "Failed to delete snapshot set members %s: %s",
+                    ", ".join(names),
+                    err,
+                )
+                # A batched delete may fail after removing some of the
+                # snapshots: drop those that are gone from the set.
+                self._prune_deleted_snapshots(snapset, provider, snapshots)
+                raise SnapmPluginError(
+                    f"Could not delete all snapshots for set {snapset.name}"
+                ) from err
+            for snapshot in snapshots:
+                snapset.snapshots.remove(snapshot)
+
+        self._remove_snapshot_set(snapset)
+
     def delete_snapshot_sets(self, selection):
         """
         Remove snapshot sets matching selection criteria ``selection``.
@@ -1043,36 +1377,12 @@ class Manager:
             raise SnapmNotFoundError(
                 f"Could not find snapshot sets matching {selection}"
             )
-        for snapset in sets:
-            if any(snapshot.snapshot_mounted for snapshot in snapset.snapshots):
-                raise SnapmBusyError(
-                    f"Snapshots from snapshot set {snapset.name} are mounted: cannot delete"
-                )
-            if snapset.status == SnapStatus.REVERTING:
-                _log_error(
-                    "Cannot operate on reverting snapshot set '%s'", snapset.name
-                )
-                raise SnapmBusyError(f"Failed to delete snapshot set {snapset.name}")
-            delete_snapset_boot_entry(snapset)
-            delete_snapset_revert_entry(snapset)
-            for snapshot in snapset.snapshots.copy():
-                try:
-                    snapshot.delete()
-                    snapset.snapshots.remove(snapshot)
-                except SnapmError as err:
-                    _log_error(
-                        "Failed to delete snapshot set member %s: %s",
-                        snapshot.name,
-                        err,
-                    )
-                    raise SnapmPluginError(
-                        f"Could not delete all snapshots for set {snapset.name}"
-                    ) from err
-
-            self.snapshot_sets.remove(snapset)
-            self.by_name.pop(snapset.name)
-            self.by_uuid.pop(snapset.uuid)
-            deleted += 1
+        self._check_deletable(sets)
+        # Clean the boom image cache once for the whole batch.
+        with deferred_cache_clean():
+            for snapset in sets:
+                self._delete_snapshot_set(snapset)
+                deleted += 1
         self._boot_cache.refresh_cache()
         return deleted
 
@@ -1145,18 +1455,15 @@ class Manager:
         for provider in providers:
             provider.end_transaction()
 
-    def revert_snapshot_set(self, name=None, uuid=None):
+    def _revert_snapshot_set(self, snapset):
         """
-        Revert snapshot set named ``name`` or having UUID ``uuid``.
+        Revert ``snapset`` without refreshing the boot entry cache.
 
-        Request to revert each snapshot origin within each snapshot set
-        to the state at the time the snapshot was taken.
+        Callers are responsible for calling ``self._boot_cache.refresh_cache()``
+        once all reverts have been started.
 
-        :param name: The name of the snapshot set to revert.
-        :param uuid: The UUID of the snapshot set to revert.
+        :param snapset: The ``SnapshotSet`` to revert.
         """
-        snapset = self._snapset_from_name_or_uuid(name=name, uuid=uuid)
-
         _check_revert_snapshot_set(snapset)
 
         # Snapshot boot entry becomes invalid as soon as revert is initiated.
@@ -1190,7 +1497,21 @@ class Manager:
                     revert_entry.title,
                 )
 
-        self._boot_cache.refresh_cache()
+    def revert_snapshot_set(self, name=None, uuid=None):
+        """
+        Revert snapshot set named ``name`` or having UUID ``uuid``.
+
+        Request to revert each snapshot origin within each snapshot set
+        to the state at the time the snapshot was taken.
+
+        :param name: The name of the snapshot set to revert.
+        :param uuid: The UUID of the snapshot set to revert.
+        """
+        snapset = self._snapset_from_name_or_uuid(name=name, uuid=uuid)
+        try:
+            self._revert_snapshot_set(snapset)
+        finally:
+            self._boot_cache.refresh_cache()
         return snapset
 
     def revert_snapshot_sets(self, selection):
@@ -1208,9 +1529,13 @@ class Manager:
             raise SnapmNotFoundError(
                 f"Could not find snapshot sets matching {selection}"
             )
-        for snapset in sets:
-            self.revert_snapshot_set(name=snapset.name)
-            reverted += 1
+        try:
+            with deferred_cache_clean():
+                for snapset in sets:
+                    self._revert_snapshot_set(snapset)
+                    reverted += 1
+        finally:
+            self._boot_cache.refresh_cache()
         return reverted
 
     def activate_snapshot_sets(self, selection):
@@ -1225,21 +1550,29 @@ class Manager:
             raise SnapmNotFoundError(
                 f"Could not find snapshot sets matching {selection}"
             )
+        # Check every snapshot set before changing any of them.
         for snapset in sets:
             _check_snapset_status(snapset, "activate")
 
-            for snapshot in snapset.snapshots:
+        for snapset in sets:
+            # Activate the snapshots belonging to each provider in one call.
+            by_provider = _snapshots_by_provider(snapset.snapshots)
+            for provider, snapshots in by_provider.items():
+                names = [snapshot.name for snapshot in snapshots]
                 try:
-                    snapshot.activate()
+                    provider.activate_snapshots(names)
                 except SnapmError as err:
                     _log_error(
-                        "Failed to activate snapshot set member %s: %s",
-                        snapshot.name,
+                        "Failed to activate snapshot set members %s: %s",
+                        ", ".join(names),
                         err,
                     )
                     raise SnapmPluginError(
                         f"Could not activate all snapshots for set {snapset.name}"
                     ) from err
+                finally:
+                    for snapshot in snapshots:
+                        snapshot.invalidate_cache()
             activated += 1
         return activated
 
@@ -1255,21 +1588,29 @@ class Manager:
             raise SnapmNotFoundError(
                 f"Could not find snapshot sets matching {selection}"
             )
+        # Check every snapshot set before changing any of them.
         for snapset in sets:
             _check_snapset_status(snapset, "deactivate")
 
-            for snapshot in snapset.snapshots:
+        for snapset in sets:
+            # Deactivate the snapshots belonging to each provider in one call.
+            by_provider = _snapshots_by_provider(snapset.snapshots)
+            for provider, snapshots in by_provider.items():
+                names = [snapshot.name for snapshot in snapshots]
                 try:
-                    snapshot.deactivate()
+                    provider.deactivate_snapshots(names)
                 except SnapmError as err:
                     _log_error(
-                        "Failed to deactivate snapshot set member %s: %s",
-                        snapshot.name,
+                        "Failed to deactivate snapshot set members %s: %s",
+                        ", ".join(names),
                         err,
                     )
                     raise SnapmPluginError(
                         f"Could not deactivate all snapshots for set {snapset.name}"
                     ) from err
+                finally:
+                    for snapshot in snapshots:
+                        snapshot.invalidate_cache()
             deactivated += 1
         return deactivated
 
@@ -1281,6 +1622,8 @@ class Manager:
         :param selection: Selection criteria for snapshot sets to set
                           autoactivation.
         :param auto: ``True`` to enable autoactivation or ``False`` otherwise.
+        :returns: The number of snapshot sets whose autoactivation status
+                  was changed.
         """
         sets = self.find_snapshot_sets(selection=selection)
         changed = 0
@@ -1288,10 +1631,13 @@ class Manager:
             raise SnapmNotFoundError(
                 f"Could not find snapshot sets matching {selection}"
             )
+        # Check every snapshot set before changing any of them.
         for snapset in sets:
             _check_snapset_status(snapset, "set autoactivate status for")
-            snapset.autoactivate = auto
-            changed += 1
+
+        for snapset in sets:
+            if snapset.set_autoactivate(auto=auto):
+                changed += 1
         return changed
 
     def create_snapshot_set_boot_entry(self, name=None, uuid=None):
@@ -1304,11 +1650,6 @@ class Manager:
         snapset = self._snapset_from_name_or_uuid(name=name, uuid=uuid)
 
         snapset.autoactivate = True
-        if not snapset.autoactivate:
-            raise SnapmPluginError(
-                "Could not enable autoactivation for all snapshots in snapshot "
-                f"set {snapset.name}"
-            )
         if snapset.boot_entry is not None:
             raise SnapmExistsError(
                 f"Boot entry already associated with snapshot set {snapset.name}"
@@ -14,6 +14,7 @@
 """
 Boot integration for snapshot manager
 """
+from contextlib import contextmanager
 from os import uname
 from os.path import exists as path_exists
 import logging
@@ -279,15 +280,47 @@ def create_snapset_revert_entry(snapset, title=None):
     )
 
 
+#: Nesting depth of active ``deferred_cache_clean()`` contexts.
+_CLEAN_CACHE_DEFERRED = 0
+
+#: Set when a boot entry was deleted while cache cleaning was deferred.
+_CLEAN_CACHE_PENDING = False
+
+
+@contextmanager
+def deferred_cache_clean():
+    """
+    Context manager that defers boom image cache cleaning.
+
+    Boot entries deleted inside the context do not trigger an immediate
+    ``boom.cache.clean_cache()`` call: the cache is cleaned once when the
+    outermost context exits, and only if an entry was deleted.
+    """
+    # pylint: disable=global-statement
+    global _CLEAN_CACHE_DEFERRED, _CLEAN_CACHE_PENDING
+    _CLEAN_CACHE_DEFERRED += 1
+    try:
+        yield
+    finally:
+        _CLEAN_CACHE_DEFERRED -= 1
+        if not _CLEAN_CACHE_DEFERRED and _CLEAN_CACHE_PENDING:
+            _CLEAN_CACHE_PENDING = False
+            boom.cache.clean_cache()
+
+
 def _delete_boot_entry(boot_id):
     """
     Delete a boom boot entry by ID.
 
     :param boot_id: The boot identifier to delete.
     """
+    global _CLEAN_CACHE_PENDING  # pylint: disable=global-statement
     selection = boom.Selection(boot_id=boot_id)
     boom.command.delete_entries(selection=selection)
-    boom.cache.clean_cache()
+    if _CLEAN_CACHE_DEFERRED:
+        _CLEAN_CACHE_PENDING = True
+    else:
+        boom.cache.clean_cache()
 
 
 def delete_snapset_boot_entry(snapset):
@@ -361,6 +394,22 @@ class BootEntryCache(dict):
             if snapset:
                 self[snapset] = boot_entry
 
+    def entry_for(self, snapset, uuid_str=None):
+        """
+        Return the boot entry for ``snapset`` looked up by name or by UUID,
+        or ``None`` if no entry exists.
+
+        :param snapset: The snapshot set to look up.
+        :param uuid_str: An optional pre-formatted string form of the
+                         snapshot set UUID.
+        :returns: A boom ``BootEntry`` or ``None``.
+        """
+        boot_entry = self.get(snapset.name)
+        if boot_entry is None:
+            uuid_str = uuid_str if uuid_str is not None else str(snapset.uuid)
+            boot_entry = self.get(uuid_str)
+        return boot_entry
+
 
 class BootCache:
     """
@@ -378,6 +427,20 @@ class BootCache:
             len(self.revert_cache),
         )
 
+    def entry_for(self, snapset):
+        """
+        Return the boot entry and revert entry for ``snapset``.
+
+        :param snapset: The snapshot set to look up.
+        :returns: A ``(boot_entry, revert_entry)`` tuple. Either value is
+                  ``None`` if the corresponding entry does not exist.
+        """
+        uuid_str = str(snapset.uuid)
+        return (
+            self.entry_cache.entry_for(snapset, uuid_str=uuid_str),
+            self.revert_cache.entry_for(snapset, uuid_str=uuid_str),
+        )
+
     def refresh_cache(self):
         """
         Refresh the cache of boot entry mappings held by this ``BootCache``
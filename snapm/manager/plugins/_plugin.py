@@ -16,6 +16,7 @@ Snapshot manager plugin helpers.
 """
 import os
 from os.path import sep as path_sep, ismount
+import re
 
 _MOUNT_SEPARATOR = "-"
 _ESCAPED_MOUNT_SEPARATOR = "--"
@@ -64,6 +65,9 @@ _bad_chars = [
     "'",
 ]
 
+# An escaped "." ("..") or an escaped bad character (".XX")
+_ESCAPE_RE = re.compile(r"\.(\.|[0-9a-fA-F]{2})")
+
 
 def _escape_bad_chars(path):
     """
@@ -92,23 +96,13 @@ def _unescape_bad_chars(path):
     :returns: The unescaped path.
     """
 
-    def decode_byte(byte):
-        return bytearray.fromhex(byte).decode("utf8")
+    def decode_escape(match):
+        escape = match.group(1)
+        if escape == ".":
+            return "."
+        return bytearray.fromhex(escape).decode("utf8")
 
-    unescaped = ""
-    i = 0
-    while i < len(path):
-        if path[i] == ".":
-            if path[i + 1] == ".":
-                unescaped = unescaped + "."
-                i += 1
-            else:
-                unescaped = unescaped + decode_byte(path[i + 1 : i + 3])
-                i += 2
-        else:
-            unescaped = unescaped + path[i]
-        i += 1
-    return unescaped
+    return _ESCAPE_RE.sub(decode_escape, path)
 
 
 def encode_mount_point(mount_point):
@@ -499,13 +499,25 @@ class Lvm2Snapshot(Snapshot):
             return False
         return True
 
+    @property
+    def cached_autoactivate(self):
+        if not self._lv_dict_cache_valid(time()):
+            return None
+        return self.autoactivate
+
     def invalidate_cache(self):
         self._lv_dict_cache = None
         self._lv_dict_cache_ts = 0
 
+    def _lv_dict_cache_valid(self, now):
+        return (
+            bool(self._lv_dict_cache)
+            and (self._lv_dict_cache_ts + LVS_CACHE_VALID) >= now
+        )
+
     def _get_lv_dict_cache(self):
         now = time()
-        if not self._lv_dict_cache or (self._lv_dict_cache_ts + LVS_CACHE_VALID) < now:
+        if not self._lv_dict_cache_valid(now):
             lvs_dict = get_lvs_json_report(f"{self.vg_name}/{self.lv_name}")
             self._lv_dict_cache = lvs_dict[LVS_REPORT][0][LVS_LV][0]
             self._lv_dict_cache_ts = now
@@ -582,11 +594,11 @@ def filter_thin_snapshot(lv_dict):
     return True
 
 
-def _activate(active, name, silent=False):
+def _activate(active, names, silent=False):
     """
-    Call lvchange to activate or deactivate an LVM2 volume.
+    Call lvchange once to activate or deactivate a list of LVM2 volumes.
 
-    :param name: The name of the LV to operate on.
+    :param names: A list of the names of the LVs to operate on.
     :param silent: ``True`` if errors should not be propagated or
                    ``False`` otherwise.
     """
@@ -596,8 +608,8 @@ def _activate(active, name, silent=False):
         LVCHANGE_IGNOREACTIVATIONSKIP,
         LVCHANGE_ACTIVATE,
         active,
-        name,
     ]
+    lvchange_cmd.extend(names)
     try:
         run(lvchange_cmd, capture_output=True, check=True)
     except CalledProcessError as err:
@@ -627,12 +639,14 @@ class _Lvm2(Plugin):
         """
         raise NotImplementedError
 
-    def can_snapshot(self, source):
+    def can_snapshot(self, source, st=None):
         """
         Test whether this plugin can snapshot the specified block device or
         mount point path.
 
         :param source: The mount point or block device path to test.
+        :param st: An optional ``os.stat_result`` for ``source``. If given
+                   it is used in place of calling ``stat()`` again.
         :returns: ``True`` if this plugin can snapshot the file system or
                   block device at ``source``, or ``False`` otherwise.
         """
@@ -689,7 +703,17 @@ class _Lvm2(Plugin):
 
         :param name: The name of the snapshot to be removed.
         """
-        lvremove_cmd = [LVREMOVE_CMD, LVREMOVE_YES, name]
+        self.delete_snapshots([name])
+
+    def delete_snapshots(self, names):
+        """
+        Delete the snapshots named in ``names`` with a single ``lvremove``
+        command.
+
+        :param names: A list of the names of the snapshots to be removed.
+        """
+        lvremove_cmd = [LVREMOVE_CMD, LVREMOVE_YES]
+        lvremove_cmd.extend(names)
         try:
             run(lvremove_cmd, capture_output=True, check=True)
         except CalledProcessError as err:
@@ -792,8 +816,17 @@ class _Lvm2(Plugin):
 
         :param name: The name of the snapshot to be activated.
         """
-        self._log_debug("Activating %s snapshot %s", self.name, name)
-        _activate(LVCHANGE_ACTIVE_YES, name)
+        self.activate_snapshots([name])
+
+    def activate_snapshots(self, names):
+        """
+        Activate the snapshots named in ``names`` with a single
+        ``lvchange`` command.
+
+        :param names: A list of the names of the snapshots to be activated.
+        """
+        self._log_debug("Activating %s snapshots %s", self.name, ", ".join(names))
+        _activate(LVCHANGE_ACTIVE_YES, names)
 
     def deactivate_snapshot(self, name):
         """
@@ -801,8 +834,17 @@ class _Lvm2(Plugin):
 
         :param name: The name of the snapshot to be deactivated.
         """
-        self._log_debug("Deactivating %s snapshot %s", self.name, name)
-        _activate(LVCHANGE_ACTIVE_NO, name, silent=True)
+        self.deactivate_snapshots([name])
+
+    def deactivate_snapshots(self, names):
+        """
+        Deactivate the snapshots named in ``names`` with a single
+        ``lvchange`` command.
+
+        :param names: A list of the names of the snapshots to be deactivated.
+        """
+        self._log_debug("Deactivating %s snapshots %s", self.name, ", ".join(names))
+        _activate(LVCHANGE_ACTIVE_NO, names, silent=True)
 
     def set_autoactivate(self, name, auto=False):
         """
@@ -916,16 +958,19 @@ class Lvm2Cow(_Lvm2):
                     )
         return snapshots
 
-    def can_snapshot(self, source):
+    def can_snapshot(self, source, st=None):
         """
         Test whether the lvm2-cow plugin can snapshot the specified ``source``.
 
         :param source: The mount point or block device path to test.
+        :param st: An optional ``os.stat_result`` for ``source``. If given
+                   it is used in place of calling ``stat()`` again.
         :returns: ``True`` if this plugin can snapshot the file system or block
                   device found at ``source``, or ``False`` otherwise.
         """
 
-        if S_ISBLK(stat(source).st_mode):
+        st = st if st is not None else stat(source)
+        if S_ISBLK(st.st_mode):
             device = source
         else:
             device = device_from_mount_point(source)
@@ -1118,15 +1163,18 @@ class Lvm2Thin(_Lvm2):
                     )
         return snapshots
 
-    def can_snapshot(self, source):
+    def can_snapshot(self, source, st=None):
         """
         Test whether the lvm2-thin plugin can snapshot the specified ``source``.
 
         :param source: The mount point or block device path to test.
+        :param st: An optional ``os.stat_result`` for ``source``. If given
+                   it is used in place of calling ``stat()`` again.
         :returns: ``True`` if this plugin can snapshot the file system or block
                   device found at ``source``, or ``False`` otherwise.
         """
-        if S_ISBLK(stat(source).st_mode):
+        st = st if st is not None else stat(source)
+        if S_ISBLK(st.st_mode):
             device = source
         else:
             device = device_from_mount_point(source)
@@ -14,11 +14,14 @@
 """
 Stratis snapshot manager plugin
 """
-from os import stat
-from os.path import join as path_join
-from subprocess import run, CalledProcessError
+from glob import glob
+import re
+from os import major, minor, stat
+from os.path import isdir, join as path_join
+from subprocess import run, CalledProcessError, DEVNULL, PIPE
 from stat import S_ISBLK
-from time import time
+from threading import Lock
+from time import monotonic
 from uuid import UUID
 
 from dbus.exceptions import DBusException
@@ -60,8 +63,6 @@ from .stratislib import (
     check_stratisd_version,
     get_object,
     TOP_OBJECT,
-    Id,
-    IdType,
     MOFilesystem,
     MOPool,
     ObjectManager,
@@ -73,6 +74,9 @@ from .stratislib import (
 
 STRATIS_UUID_PREFIX = "stratis-1-"
 
+# Device-mapper UUID of a Stratis filesystem thin device.
+STRATIS_FS_DM_UUID_RE = re.compile(r"^stratis-1-([0-9a-f]{32})-thin-fs-([0-9a-f]{32})$")
+
 STRATIS_DECODE_DM_CMD = "stratis-decode-dm"
 STRATIS_DECODE_DM_OUTPUT = "--output"
 STRATIS_DECODE_DM_SYMLINK = "symlink"
@@ -81,10 +85,233 @@ DBUS_CACHE_VALID = 5
 
 DEV_STRATIS_PREFIX = "/dev/stratis/"
 
+SYS_BLOCK = "/sys/block"
+SYS_DEV_BLOCK = "/sys/dev/block"
+
 # Minimum allowed Stratis snapshot size (512MiB)
 MIN_STRATIS_SNAPSHOT_SIZE = 512 * 1024**2
 
 
+def _uuid_hex(value):
+    """
+    Return the canonical (undashed hex) form of a UUID string.
+
+    :param value: A UUID string as returned by stratisd.
+    :returns: The UUID as a 32 character hex string.
+    """
+    return UUID(str(value)).hex
+
+
+class _ManagedObjectsIndex:
+    """
+    Lookup tables for the pools and filesystems in a stratisd
+    ``GetManagedObjects`` reply.
+
+    The reply is scanned once when the index is built so that later pool
+    and filesystem lookups are dictionary lookups rather than a search of
+    the whole object tree.
+    """
+
+    def __init__(self, managed_objects):
+        """
+        Build the index for ``managed_objects``.
+
+        :param managed_objects: The stratisd managed objects to index.
+        """
+        self.pools_by_name = {}
+        self.pools_by_uuid = {}
+        self.pool_names = {}
+        self.pool_filesystems = {}
+        self.filesystems_by_name = {}
+        self.filesystems_by_uuid = {}
+
+        for object_path, info in pools().search(managed_objects):
+            pool = MOPool(info)
+            pool_name = str(pool.Name())
+            self.pools_by_name[pool_name] = (object_path, pool)
+            self.pools_by_uuid[_uuid_hex(pool.Uuid())] = (object_path, pool)
+            self.pool_names[object_path] = pool_name
+            self.pool_filesystems[object_path] = []
+
+        for object_path, info in filesystems().search(managed_objects):
+            filesystem = MOFilesystem(info)
+            pool_object_path = filesystem.Pool()
+            entry = (object_path, filesystem)
+            self.pool_filesystems.setdefault(pool_object_path, []).append(entry)
+            fs_name = str(filesystem.Name())
+            self.filesystems_by_name[(pool_object_path, fs_name)] = entry
+            fs_uuid = _uuid_hex(filesystem.Uuid())
+            self.filesystems_by_uuid[(pool_object_path, fs_uuid)] = entry
+
+    def pool(self, pool_name):
+        """
+        Return the ``(object_path, MOPool)`` tuple for the pool named
+        ``pool_name``.
+
+        :param pool_name: The name of the pool to look up.
+        :raises: ``SnapmNotFoundError`` if no such pool exists.
+        """
+        try:
+            return self.pools_by_name[pool_name]
+        except KeyError as err:
+            raise SnapmNotFoundError(f"Stratis pool {pool_name} not found") from err
+
+    def filesystem(self, pool_object_path, fs_name):
+        """
+        Return the ``(object_path, MOFilesystem)`` tuple for the filesystem
+        named ``fs_name`` in the pool at ``pool_object_path``.
+
+        :param pool_object_path: The pool DBus object path.
+        :param fs_name: The name of the filesystem to look up.
+        :raises: ``SnapmNotFoundError`` if no such filesystem exists.
+        """
+        try:
+            return self.filesystems_by_name[(pool_object_path, fs_name)]
+        except KeyError as err:
+            pool_name = self.pool_names.get(pool_object_path, pool_object_path)
+            raise SnapmNotFoundError(
+                f"Stratis filesystem {pool_name}/{fs_name} not found"
+            ) from err
+
+    def filesystem_by_uuid(self, pool_object_path, fs_uuid):
+        """
+        Return the ``(object_path, MOFilesystem)`` tuple for the filesystem
+        with UUID ``fs_uuid`` in the pool at ``pool_object_path``.
+
+        :param pool_object_path: The pool DBus object path.
+        :param fs_uuid: The UUID of the filesystem to look up.
+        :raises: ``SnapmNotFoundError`` if no such filesystem exists.
+        """
+        try:
+            return self.filesystems_by_uuid[(pool_object_path, _uuid_hex(fs_uuid))]
+        except KeyError as err:
+            pool_name = self.pool_names.get(pool_object_path, pool_object_path)
+            raise SnapmNotFoundError(
+                f"Stratis filesystem with UUID {fs_uuid} not found in pool {pool_name}"
+            ) from err
+
+
+class _ManagedObjectsCache:
+    """
+    Process-wide cache of the stratisd ``GetManagedObjects`` reply.
+
+    The reply contains the complete stratisd object tree and is shared, along
+    with its ``_ManagedObjectsIndex``, by all plugin operations and
+    ``StratisSnapshot`` instances. It is re-fetched once it is older than
+    ``DBUS_CACHE_VALID`` seconds, or immediately after ``invalidate()`` is
+    called following a change made through stratisd.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._index = None
+        self._timestamp = 0
+
+    def get(self, force=False):
+        """
+        Return the index of the stratisd managed objects, fetching them if
+        the cached copy is missing, expired or ``force`` is ``True``.
+
+        :param force: Always fetch a fresh copy of the managed objects.
+        :returns: A ``_ManagedObjectsIndex`` for the managed objects.
+        :raises: ``SnapmPluginError`` if stratisd cannot be reached.
+        """
+        with self._lock:
+            if (
+                force
+                or self._index is None
+                or (self._timestamp + DBUS_CACHE_VALID) < monotonic()
+            ):
+                self._index = _ManagedObjectsIndex(self._fetch())
+                self._timestamp = monotonic()
+            return self._index
+
+    @staticmethod
+    def _fetch():
+        """
+        Fetch the managed objects from stratisd.
+
+        :returns: The ``GetManagedObjects`` reply.
+        :raises: ``SnapmPluginError`` if stratisd cannot be reached.
+        """
+        try:
+            proxy = get_object(TOP_OBJECT)
+            return ObjectManager.Methods.GetManagedObjects(proxy, {})
+        except (DBusException, DPClientInvocationError) as err:
+            raise SnapmPluginError(
+                f"Failed to communicate with stratisd: {err}"
+            ) from err
+
+    def invalidate(self):
+        """
+        Discard the cached managed objects.
+        """
+        with self._lock:
+            self._index = None
+            self._timestamp = 0
+
+
+_MO_CACHE = _ManagedObjectsCache()
+
+
+def _get_managed_objects_index(force=False):
+    """
+    Return the index of the (possibly cached) stratisd managed objects.
+
+    :param force: Always fetch a fresh copy of the managed objects.
+    :returns: A ``_ManagedObjectsIndex`` for the managed objects.
+    """
+    return _MO_CACHE.get(force=force)
+
+
+def _invalidate_managed_objects():
+    """
+    Discard the cached stratisd managed objects. Must be called after any
+    change is made to pools or filesystems through stratisd.
+    """
+    _MO_CACHE.invalidate()
+
+
+def _read_dm_uuid(uuid_path):
+    """
+    Read a device-mapper UUID from the sysfs ``dm/uuid`` attribute at
+    ``uuid_path``.
+
+    :param uuid_path: The path to the ``dm/uuid`` sysfs attribute.
+    :returns: The device-mapper UUID or the empty string if the attribute
+              does not exist.
+    """
+    try:
+        with open(uuid_path, "r", encoding="utf8") as uuid_file:
+            return uuid_file.read().strip()
+    except FileNotFoundError:
+        return ""
+
+
+def _dm_uuid_from_sysfs(devpath):
+    """
+    Return the device-mapper UUID for ``devpath`` from sysfs.
+
+    :param devpath: The path to the block device to examine.
+    :returns: The device-mapper UUID, the empty string if ``devpath`` is not a
+              device-mapper device, or ``None`` if the UUID cannot be read
+              from sysfs.
+    """
+    if not isdir(SYS_DEV_BLOCK):
+        return None
+    try:
+        st = stat(devpath)
+    except OSError:
+        return None
+    if not S_ISBLK(st.st_mode):
+        return None
+    dev = f"{major(st.st_rdev)}:{minor(st.st_rdev)}"
+    try:
+        return _read_dm_uuid(path_join(SYS_DEV_BLOCK, dev, "dm", "uuid"))
+    except OSError:
+        return None
+
+
 def is_stratis_device(devpath):
     """
     Test whether ``devpath`` is a Stratis device.
@@ -92,6 +319,10 @@ def is_stratis_device(devpath):
     Return ``True`` if the device at ``devpath`` is a Stratis device or
     ``False`` otherwise.
     """
+    uuid = _dm_uuid_from_sysfs(devpath)
+    if uuid is not None:
+        return uuid.startswith(STRATIS_UUID_PREFIX)
+
     dmsetup_cmd_args = [
         DMSETUP_CMD,
         DMSETUP_INFO,
@@ -132,6 +363,15 @@ def stratis_devices_present():
 
     :returns: ``True`` if stratis devices exist or ``False`` otherwise.
     """
+    if isdir(SYS_BLOCK):
+        try:
+            for uuid_path in glob(path_join(SYS_BLOCK, "dm-*", "dm", "uuid")):
+                if _read_dm_uuid(uuid_path).startswith(STRATIS_UUID_PREFIX):
+                    return True
+            return False
+        except OSError:
+            pass
+
     dmsetup_cmd_args = [
         DMSETUP_CMD,
         DMSETUP_INFO,
@@ -140,13 +380,41 @@ def stratis_devices_present():
         DMSETUP_FIELDS_UUID,
     ]
     try:
-        dmsetup_cmd = run(dmsetup_cmd_args, capture_output=True, check=True)
+        dmsetup_cmd = run(dmsetup_cmd_args, stdout=PIPE, stderr=DEVNULL, check=True)
     except CalledProcessError as err:  # pragma: no cover
         raise SnapmCalloutError(f"Error calling {DMSETUP_CMD}") from err
-    for uuid in dmsetup_cmd.stdout.decode("utf8").strip().splitlines():
-        if uuid.startswith(STRATIS_UUID_PREFIX):
-            return True
-    return False
+    prefix = STRATIS_UUID_PREFIX.encode("utf8")
+    uuids = dmsetup_cmd.stdout.lstrip()
+    return uuids.startswith(prefix) or b"\n" + prefix in uuids
+
+
+def _pool_fs_from_dm_uuid(dm_uuid):
+    """
+    Return a ``(pool_name, fs_name)`` tuple for the Stratis filesystem with
+    device-mapper UUID ``dm_uuid`` by looking up the pool and filesystem
+    UUIDs it contains in the stratisd managed objects.
+
+    :param dm_uuid: The device-mapper UUID of a Stratis filesystem device.
+    :returns: A ``(pool_name, fs_name)`` tuple, or ``None`` if the UUID is not
+              a Stratis filesystem UUID or cannot be resolved.
+    """
+    match = STRATIS_FS_DM_UUID_RE.match(dm_uuid)
+    if not match:
+        return None
+    (pool_uuid, fs_uuid) = match.groups()
+    try:
+        index = _get_managed_objects_index()
+    except SnapmPluginError:
+        return None
+    pool_entry = index.pools_by_uuid.get(pool_uuid)
+    if pool_entry is None:
+        return None
+    (pool_object_path, _) = pool_entry
+    fs_entry = index.filesystems_by_uuid.get((pool_object_path, fs_uuid))
+    if fs_entry is None:
+        return None
+    (_, filesystem) = fs_entry
+    return (index.pool_names[pool_object_path], str(filesystem.Name()))
 
 
 def pool_fs_from_device_path(devpath):
@@ -154,6 +422,12 @@ def pool_fs_from_device_path(devpath):
     Return a ``(pool_name, fs_name)`` tuple for the Stratis device at
     ``devpath``.
     """
+    dm_uuid = _dm_uuid_from_sysfs(devpath)
+    if dm_uuid:
+        pool_fs = _pool_fs_from_dm_uuid(dm_uuid)
+        if pool_fs is not None:
+            return pool_fs
+
     stratis_decode_dm_cmd_args = [
         STRATIS_DECODE_DM_CMD,
         STRATIS_DECODE_DM_OUTPUT,
@@ -162,12 +436,13 @@ def pool_fs_from_device_path(devpath):
     ]
     try:
         stratis_decode_dm_cmd = run(
-            stratis_decode_dm_cmd_args, capture_output=True, check=True
+            stratis_decode_dm_cmd_args, stdout=PIPE, stderr=DEVNULL, check=True
         )
     except CalledProcessError as err:  # pragma: no cover
         raise SnapmCalloutError(f"Error calling {STRATIS_DECODE_DM_CMD}") from err
     symlink = stratis_decode_dm_cmd.stdout.decode("utf8").strip()
-    return symlink.removeprefix(DEV_STRATIS_PREFIX).split("/")
+    (pool_name, _, fs_name) = symlink.removeprefix(DEV_STRATIS_PREFIX).partition("/")
+    return (pool_name, fs_name)
 
 
 def pool_fs_from_origin(origin):
@@ -175,12 +450,17 @@ def pool_fs_from_origin(origin):
     Return a ``(pool_name, fs_name)`` tuple for the Stratis device with
     origin path ``origin``.
     """
-    return origin.removeprefix(DEV_STRATIS_PREFIX).split("/")
+    (pool_name, _, fs_name) = origin.removeprefix(DEV_STRATIS_PREFIX).partition("/")
+    return (pool_name, fs_name)
 
 
 class StratisSnapshot(Snapshot):
     """
     Class for Stratis snapshot objects.
+
+    The pool and filesystem managed objects are looked up on first use. A
+    caller that already holds them (with the ``_ManagedObjectsIndex`` they
+    came from) may pass them in via ``index``, ``pool`` and ``filesystem``.
     """
 
     # pylint: disable=too-many-arguments
@@ -194,14 +474,16 @@ class StratisSnapshot(Snapshot):
         provider,
         pool_name,
         fs_name,
+        index=None,
+        pool=None,
+        filesystem=None,
     ):
         super().__init__(name, snapset_name, origin, timestamp, mount_point, provider)
         self.pool_name = pool_name
         self.fs_name = fs_name
-        self._pool = None
-        self._filesystem = None
-        self._cache_ts = 0
-        self._get_dbus_cache()
+        self._pool = pool
+        self._filesystem = filesystem
+        self._index = index
 
     def __str__(self):
         return "".join(
@@ -245,40 +527,33 @@ class StratisSnapshot(Snapshot):
     @property
     def free(self):
         (pool, _) = self._get_dbus_cache()
-        size = int(pool.TotalPhysicalSize())
-        used = int(pool.TotalPhysicalUsed()[1]) if pool.TotalPhysicalUsed()[0] else 0
-        return size - used
+        return _pool_free_bytes(pool)
 
     @property
     def autoactivate(self):
         # Stratis filesystems always autoactivate with the pool
         return True
 
+    @property
+    def cached_autoactivate(self):
+        return self.autoactivate
+
     def invalidate_cache(self):
         self._pool = None
         self._filesystem = None
-        self._cache_ts = 0
+        self._index = None
 
     def _get_dbus_cache(self):
-        now = time()
-        if (
-            not (self._pool and self._filesystem)
-            or (self._cache_ts + DBUS_CACHE_VALID) < now
-        ):
-            try:
-                proxy = get_object(TOP_OBJECT)
-                managed_objects = ObjectManager.Methods.GetManagedObjects(proxy, {})
-            except DBusException as err:
-                raise SnapmPluginError(
-                    f"Failed to communicate with stratisd: {err}"
-                ) from err
-
+        # The pool and filesystem objects are re-derived only when the shared
+        # managed objects reply has been replaced (expired or invalidated).
+        index = _get_managed_objects_index()
+        if not (self._pool and self._filesystem) or self._index is not index:
             (pool, filesystem) = _get_pool_filesystem(
-                managed_objects, self.pool_name, self.fs_name
+                index, self.pool_name, self.fs_name
             )
             self._pool = pool
             self._filesystem = filesystem
-            self._cache_ts = time()
+            self._index = index
         return (self._pool, self._filesystem)
 
 
@@ -304,118 +579,90 @@ def _snapshot_min_size(policy_size):
     return max(MIN_STRATIS_SNAPSHOT_SIZE, policy_size)
 
 
-def _get_pool_filesystem(managed_objects, pool_name, fs_name):
+def _pool_free_bytes(pool):
+    """
+    Return the free space in bytes for the pool managed object ``pool``.
+
+    :param pool: A ``MOPool`` managed object.
+    :returns: The pool's total physical size less its physical space used.
+    """
+    size = int(pool.TotalPhysicalSize())
+    (used_valid, used) = pool.TotalPhysicalUsed()
+    return size - (int(used) if used_valid else 0)
+
+
+def _get_pool_filesystem(index, pool_name, fs_name):
     """
     Return pool and filesystem managed objects.
 
-    :param managed_objects: The managed objects to search.
+    :param index: The ``_ManagedObjectsIndex`` to search.
     :param pool_name: The name of the pool to return.
     :param fs_name: The name of the filesystem to return, or ``None``
                     to query only the pool.
     """
-    props = {"Name": pool_name}
-    pool_object_path = next(
-        pools(props=props).require_unique_match(True).search(managed_objects)
-    )[0]
-
+    (pool_object_path, pool) = index.pool(pool_name)
     if fs_name is not None:
-        fs_id = Id(IdType.NAME, fs_name)
-        fs_props = {"Pool": pool_object_path} | fs_id.managed_objects_key()
-
-        filesystem = [
-            MOFilesystem(info)
-            for objpath, info in filesystems(props=fs_props)
-            .require_unique_match(True)
-            .search(managed_objects)
-        ][0]
+        (_, filesystem) = index.filesystem(pool_object_path, fs_name)
     else:
         filesystem = None
-
-    pool = [
-        MOPool(info)
-        for objpath, info in pools(props=props)
-        .require_unique_match(True)
-        .search(managed_objects)
-    ][0]
     return (pool, filesystem)
 
 
-def _origin_uuid_to_fs_name(managed_objects, pool_object_path, origin_uuid):
+def _origin_uuid_to_fs_name(index, pool_object_path, origin_uuid):
     """
     Return the filesystem corresponding to `origin_uuid`.
-    :param managed_objects: DBus managed objects for the service
+    :param index: The ``_ManagedObjectsIndex`` to search.
     :param pool_object_path: The pool DBus object path
     :param origin_uuid: The origin UUID to find.
     """
-    fs_id = Id(IdType.UUID, UUID(origin_uuid))
-    fs_props = {"Pool": pool_object_path} | fs_id.managed_objects_key()
-
-    filesystem = [
-        MOFilesystem(info)
-        for objpath, info in filesystems(props=fs_props)
-        .require_unique_match(True)
-        .search(managed_objects)
-    ][0]
-
+    (_, filesystem) = index.filesystem_by_uuid(pool_object_path, origin_uuid)
     return str(filesystem.Name())
 
 
-def _fs_name_to_uuid(managed_objects, pool_object_path, fs_name):
+def _fs_name_to_uuid(index, pool_object_path, fs_name):
     """
     Return the filesystem UUID corresponding to `origin_name`.
-    :param managed_objects: DBus managed objects for the service
+    :param index: The ``_ManagedObjectsIndex`` to search.
     :param pool_object_path: The pool DBus object path
     :param origin_name: The origin filesystem name to find
     """
-    fs_props = {"Pool": pool_object_path, "Name": fs_name}
-
-    filesystem = [
-        MOFilesystem(info)
-        for objpath, info in filesystems(props=fs_props)
-        .require_unique_match(True)
-        .search(managed_objects)
-    ][0]
-
+    (_, filesystem) = index.filesystem(pool_object_path, fs_name)
     return str(filesystem.Uuid())
 
 
-def _find_in_progress_merge(managed_objects, pool_object_path, origin_uuid):
+def _find_in_progress_merge(index, pool_object_path, origin_uuid):
     """
-    Return a list containing any in-progres merge for the specified
-    `pool_object_path` and `origin_uuid`, or the empty list if no merge is
-    in progress.
-    :param managed_objects: DBus managed objects for the service
+    Return the filesystem with an in-progress merge for the specified
+    `pool_object_path` and `origin_uuid`, or ``None`` if no merge is in
+    progress.
+    :param index: The ``_ManagedObjectsIndex`` to search.
     :param pool_object_path: The pool DBus object path
     :param origin_uuid: The origin filesystem uuid to find
     """
-    fs_props = {
-        "Pool": pool_object_path,
-        "Origin": (True, origin_uuid),
-        "MergeScheduled": True,
-    }
-
-    return [
-        MOFilesystem(info)
-        for objpath, info in filesystems(props=fs_props).search(managed_objects)
-    ]
+    origin_uuid = _uuid_hex(origin_uuid)
+    for _, filesystem in index.pool_filesystems.get(pool_object_path, []):
+        (has_origin, fs_origin) = filesystem.Origin()
+        if not has_origin or not filesystem.MergeScheduled():
+            continue
+        if _uuid_hex(fs_origin) == origin_uuid:
+            return filesystem
+    return None
 
 
-def _pool_free_space_bytes(managed_objects, pool_name):
+def _pool_free_space_bytes(index, pool_name):
     """
     Return the free space available as bytes for the Stratis pool named
     ``pool_name``.
     """
-    (pool, _) = _get_pool_filesystem(managed_objects, pool_name, None)
-    size = int(pool.TotalPhysicalSize())
-    used = int(pool.TotalPhysicalUsed()[1]) if pool.TotalPhysicalUsed()[0] else 0
-    return size - used
+    (pool, _) = _get_pool_filesystem(index, pool_name, None)
+    return _pool_free_bytes(pool)
 
 
-def _fs_size_bytes(managed_objects, pool_name, fs_name):
+def _fs_size_bytes(index, pool_name, fs_name):
     """
     Return the size of the specified filesystem in bytes.
     """
-    (_, filesystem) = _get_pool_filesystem(managed_objects, pool_name, fs_name)
+    (_, filesystem) = _get_pool_filesystem(index, pool_name, fs_name)
     return int(filesystem.Size())
 
 
@@ -460,69 +707,66 @@ class Stratis(Plugin):
         """
         snapshots = []
 
-        try:
-            proxy = get_object(TOP_OBJECT)
-            managed_objects = ObjectManager.Methods.GetManagedObjects(proxy, {})
-        except DBusException as err:
-            raise SnapmPluginError(
-                f"Failed to communicate with stratisd: {err}"
-            ) from err
+        # Discovery always starts from a fresh view of stratisd state.
+        index = _get_managed_objects_index(force=True)
 
-        path_to_name = dict(
-            (path, MOPool(info).Name())
-            for path, info in pools().search(managed_objects)
-        )
+        for pool_object_path, pool_filesystems in index.pool_filesystems.items():
+            pool_name = index.pool_names.get(pool_object_path)
+            if pool_name is None:
+                continue
 
-        filesystems_with_props = [
-            MOFilesystem(info)
-            for objpath, info in filesystems(props=None)
-            .require_unique_match(False)
-            .search(managed_objects)
-        ]
+            (_, pool) = index.pool(pool_name)
 
-        for filesystem in filesystems_with_props:
-            if not filter_stratis_snapshot(filesystem):
-                continue
+            for _, filesystem in pool_filesystems:
+                # Inline filter_stratis_snapshot() to read Origin() only once.
+                (has_origin, origin_uuid) = filesystem.Origin()
+                if not has_origin:
+                    continue
 
-            pool_name = path_to_name[filesystem.Pool()]
-            filesystem_name = str(filesystem.Name())
+                filesystem_name = str(filesystem.Name())
 
-            origin = _origin_uuid_to_fs_name(
-                managed_objects, filesystem.Pool(), str(filesystem.Origin()[1])
-            )
+                origin = _origin_uuid_to_fs_name(
+                    index, pool_object_path, str(origin_uuid)
+                )
 
-            try:
-                fields = parse_snapshot_name(filesystem_name, origin)
-            except ValueError:
-                continue
-            if fields is not None:
-                (snapset, timestamp, mount_point) = fields
-                full_name = f"{pool_name}/{filesystem_name}"
-                self._log_debug("Found %s snapshot: %s", self.name, full_name)
-                snapshots.append(
-                    StratisSnapshot(
-                        full_name,
-                        snapset,
-                        origin,
-                        timestamp,
-                        mount_point,
-                        self,
-                        pool_name,
-                        filesystem_name,
+                try:
+                    fields = parse_snapshot_name(filesystem_name, origin)
+                except ValueError:
+                    continue
+                if fields is not None:
+                    (snapset, timestamp, mount_point) = fields
+                    full_name = f"{pool_name}/{filesystem_name}"
+                    self._log_debug("Found %s snapshot: %s", self.name, full_name)
+                    snapshots.append(
+                        StratisSnapshot(
+                            full_name,
+                            snapset,
+                            origin,
+                            timestamp,
+                            mount_point,
+                            self,
+                            pool_name,
+                            filesystem_name,
+                            index=index,
+                            pool=pool,
+                            filesystem=filesystem,
+                        )
                     )
-                )
 
         return snapshots
 
-    def can_snapshot(self, source):
+    def can_snapshot(self, source, st=None):
         """
         Test whether this plugin can snapshot the specified mount point.
 
         :param source: The mount point path to test.
+        :param st: An optional ``os.stat_result`` for ``source``. If given
+                   it is used in place of calling ``stat()`` again.
         :returns: ``True`` if this plugin can snapshot the file system mounted
                   at ``mount_point``, or ``False`` otherwise.
         """
-        if S_ISBLK(stat(source).st_mode):
+        st = st if st is not None else stat(source)
+        if S_ISBLK(st.st_mode):
             device = source
         else:
             device = device_from_mount_point(source)
@@ -535,23 +779,24 @@ class Stratis(Plugin):
         return True
 
     # pylint: disable=too-many-arguments
-    def _check_free_space(self, managed_objects, origin, mount_point, size_policy):
+    def _check_free_space(self, pool, filesystem, origin, mount_point, size_policy):
         """
-        Check for available space in pool ``pool_name`` for the specified
+        Check for available space in pool ``pool`` for the specified
         mount point.
 
-        :param pool_name: The name of the pool to check.
-        :param fs_name: The name of the filesystem to check.
+        :param pool: The ``MOPool`` managed object for the origin's pool.
+        :param filesystem: The ``MOFilesystem`` managed object for the origin.
+        :param origin: The origin volume for the snapshot.
         :param mount_point: The mount point path to check.
         :param size_policy: The size policy to be applied.
         :returns: The minimum size required for the snapshot.
         :raises: ``SnapmNoSpaceError`` if the minimum snapshot size exceeds the
                  available space.
         """
-        pool_name, fs_name = pool_fs_from_origin(origin)
+        pool_name = str(pool.Name())
         fs_used = mount_point_space_used(mount_point)
-        pool_free = _pool_free_space_bytes(managed_objects, pool_name)
-        fs_size = _fs_size_bytes(managed_objects, pool_name, fs_name)
+        pool_free = _pool_free_bytes(pool)
+        fs_size = int(filesystem.Size())
         policy = SizePolicy(
             origin, mount_point, pool_free, fs_used, fs_size, size_policy
         )
@@ -577,18 +822,13 @@ class Stratis(Plugin):
                  create the snapshot.
         """
         pool_name, fs_name = pool_fs_from_origin(origin)
-        try:
-            proxy = get_object(TOP_OBJECT)
-            managed_objects = ObjectManager.Methods.GetManagedObjects(proxy, {})
-        except DBusException as err:
-            raise SnapmPluginError(
-                f"Failed to communicate with stratisd: {err}"
-            ) from err
+        index = _get_managed_objects_index()
+        (pool, filesystem) = _get_pool_filesystem(index, pool_name, fs_name)
 
         if pool_name not in self.size_map:
             self.size_map[pool_name] = {}
             self.size_map[pool_name][fs_name] = self._check_free_space(
-                managed_objects, origin, mount_point, size_policy
+                pool, filesystem, origin, mount_point, size_policy
             )
 
     # pylint: disable=too-many-arguments
@@ -611,15 +851,13 @@ class Stratis(Plugin):
             fs_name, snapset_name, timestamp, encode_mount_point(mount_point)
         )
 
-        try:
-            proxy = get_object(TOP_OBJECT)
-            managed_objects = ObjectManager.Methods.GetManagedObjects(proxy, {})
-        except DBusException as err:
-            raise SnapmPluginError(
-                f"Failed to communicate with stratisd: {err}"
-            ) from err
+        index = _get_managed_objects_index()
+        (pool_object_path, pool) = index.pool(pool_name)
+        (origin_fs_object_path, origin_fs) = index.filesystem(
+            pool_object_path, fs_name
+        )
 
-        self._check_free_space(managed_objects, origin, mount_point, size_policy)
+        self._check_free_space(pool, origin_fs, origin, mount_point, size_policy)
 
         self._log_debug(
             "Creating Stratis snapshot for %s/%s mounted at %s",
@@ -627,21 +865,12 @@ class Stratis(Plugin):
             fs_name,
             mount_point,
         )
-        (pool_object_path, _) = next(
-            pools(props={"Name": pool_name})
-            .require_unique_match(True)
-            .search(managed_objects)
-        )
-        (origin_fs_object_path, _) = next(
-            filesystems(props={"Name": fs_name, "Pool": pool_object_path})
-            .require_unique_match(True)
-            .search(managed_objects)
-        )
 
         ((changed, _), return_code, message) = Pool.Methods.SnapshotFilesystem(
             get_object(pool_object_path),
             {"origin": origin_fs_object_path, "snapshot_name": snapshot_name},
         )
+        _invalidate_managed_objects()
 
         if return_code != StratisdErrors.OK:  # pragma: no cover
             raise SnapmPluginError(message)
@@ -678,64 +907,57 @@ class Stratis(Plugin):
 
         :param name: The name of the snapshot to be removed.
         """
-        (pool_name, fs_name) = name.split("/")
-        fs_name = [fs_name]
-
-        try:
-            proxy = get_object(TOP_OBJECT)
-            managed_objects = ObjectManager.Methods.GetManagedObjects(proxy, {})
-        except DBusException as err:
-            raise SnapmPluginError(
-                f"Failed to communicate with stratisd: {err}"
-            ) from err
-
-        (pool_object_path, _) = next(
-            pools(props={"Name": pool_name})
-            .require_unique_match(True)
-            .search(managed_objects)
-        )
-
-        requested_names = frozenset(fs_name)
+        self.delete_snapshots([name])
 
-        pool_filesystems = {
-            MOFilesystem(info).Name(): op
-            for (op, info) in filesystems(props={"Pool": pool_object_path}).search(
-                managed_objects
-            )
-        }
-        already_removed = requested_names.difference(frozenset(pool_filesystems.keys()))
+    def delete_snapshots(self, names):
+        """
+        Delete the snapshots named in ``names`` with a single
+        ``DestroyFilesystems`` call for each pool.
 
-        if already_removed != frozenset():  # pragma: no cover
-            raise SnapmPluginError(
-                f"Stratisd destroy reported snapshot already removed: {already_removed}"
+        :param names: A list of the names of the snapshots to be removed.
+        """
+        by_pool = {}
+        for name in names:
+            (pool_name, _, fs_name) = name.partition("/")
+            by_pool.setdefault(pool_name, []).append(fs_name)
+
+        index = _get_managed_objects_index()
+
+        for pool_name, fs_names in by_pool.items():
+            (pool_object_path, _) = index.pool(pool_name)
+
+            fs_object_paths = []
+            for fs_name in fs_names:
+                entry = index.filesystems_by_name.get((pool_object_path, fs_name))
+                if entry is None:  # pragma: no cover
+                    raise SnapmPluginError(
+                        f"Stratisd destroy reported snapshot already removed: {fs_name}"
+                    )
+                fs_object_paths.append(entry[0])
+
+            (
+                (destroyed, list_destroyed),
+                return_code,
+                message,
+            ) = Pool.Methods.DestroyFilesystems(
+                get_object(pool_object_path), {"filesystems": fs_object_paths}
             )
+            _invalidate_managed_objects()
 
-        fs_object_paths = [
-            op for (name, op) in pool_filesystems.items() if name in requested_names
-        ]
-
-        (
-            (destroyed, list_destroyed),
-            return_code,
-            message,
-        ) = Pool.Methods.DestroyFilesystems(
-            get_object(pool_object_path), {"filesystems": fs_object_paths}
-        )
+            if return_code != StratisdErrors.OK:  # pragma: no cover
+                raise SnapmPluginError(message)
 
-        if return_code != StratisdErrors.OK:  # pragma: no cover
-            raise SnapmPluginError(message)
-
-        if not destroyed or len(list_destroyed) < len(
-            fs_object_paths
-        ):  # pragma: no cover
-            raise SnapmPluginError(
-                (
-                    f"Expected to destroy the specified filesystems in pool "
-                    f"{pool_name} but stratisd reports that it did not"
-                    f"actually destroy some or all of the filesystems "
-                    f"requested"
+            if not destroyed or len(list_destroyed) < len(
+                fs_object_paths
+            ):  # pragma: no cover
+                raise SnapmPluginError(
+                    (
+                        f"Expected to destroy the specified filesystems in pool "
+                        f"{pool_name} but stratisd reports that it did not"
+                        f"actually destroy some or all of the filesystems "
+                        f"requested"
+                    )
                 )
-            )
 
     # pylint: disable=too-many-arguments
     def rename_snapshot(self, old_name, origin, snapset_name, timestamp, mount_point):
@@ -749,7 +971,7 @@ class Stratis(Plugin):
         :param timestamp: The snapshot set timestamp.
         :param mount_point: The mount point of the snapshot.
         """
-        (pool_name, fs_name) = old_name.split("/")
+        (pool_name, _, fs_name) = old_name.partition("/")
         _, origin = pool_fs_from_origin(origin)
         new_name = format_snapshot_name(
             origin, snapset_name, timestamp, encode_mount_point(mount_point)
@@ -761,27 +983,14 @@ class Stratis(Plugin):
             new_name,
         )
 
-        try:
-            proxy = get_object(TOP_OBJECT)
-            managed_objects = ObjectManager.Methods.GetManagedObjects(proxy, {})
-        except DBusException as err:
-            raise SnapmPluginError(
-                f"Failed to communicate with stratisd: {err}"
-            ) from err
+        index = _get_managed_objects_index()
 
-        (pool_object_path, _) = next(
-            pools(props={"Name": pool_name})
-            .require_unique_match(True)
-            .search(managed_objects)
-        )
-        (fs_object_path, _) = next(
-            filesystems(props={"Name": fs_name, "Pool": pool_object_path})
-            .require_unique_match(True)
-            .search(managed_objects)
-        )
+        (pool_object_path, _) = index.pool(pool_name)
+        (fs_object_path, _) = index.filesystem(pool_object_path, fs_name)
         ((changed, _), return_code, message) = Filesystem.Methods.SetName(
             get_object(fs_object_path), {"name": new_name}
         )
+        _invalidate_managed_objects()
 
         if return_code != StratisdErrors.OK:  # pragma: no cover
             raise SnapmPluginError(
@@ -813,18 +1022,13 @@ class Stratis(Plugin):
                  if another error occurs.
         """
         pool_name, fs_name = pool_fs_from_origin(origin)
-        try:
-            proxy = get_object(TOP_OBJECT)
-            managed_objects = ObjectManager.Methods.GetManagedObjects(proxy, {})
-        except DBusException as err:
-            raise SnapmPluginError(
-                f"Failed to communicate with stratisd: {err}"
-            ) from err
+        index = _get_managed_objects_index()
+        (pool, filesystem) = _get_pool_filesystem(index, pool_name, fs_name)
 
         if pool_name not in self.size_map:
             self.size_map[pool_name] = {}
             self.size_map[pool_name][fs_name] = self._check_free_space(
-                managed_objects, origin, mount_point, size_policy
+                pool, filesystem, origin, mount_point, size_policy
             )
 
     def resize_snapshot(self, name, origin, mount_point, size_policy):
@@ -849,26 +1053,14 @@ class Stratis(Plugin):
         """
         pool_name, origin = pool_fs_from_origin(origin)
 
-        try:
-            proxy = get_object(TOP_OBJECT)
-            managed_objects = ObjectManager.Methods.GetManagedObjects(proxy, {})
-        except DBusException as err:
-            raise SnapmPluginError(
-                f"Failed to communicate with stratisd: {err}"
-            ) from err
+        index = _get_managed_objects_index()
 
-        (pool_object_path, _) = next(
-            pools(props={"Name": pool_name})
-            .require_unique_match(True)
-            .search(managed_objects)
-        )
+        (pool_object_path, _) = index.pool(pool_name)
 
-        origin_uuid = _fs_name_to_uuid(managed_objects, pool_object_path, origin)
-        in_progress = _find_in_progress_merge(
-            managed_objects, pool_object_path, origin_uuid
-        )
+        origin_uuid = _fs_name_to_uuid(index, pool_object_path, origin)
+        in_progress = _find_in_progress_merge(index, pool_object_path, origin_uuid)
 
-        if len(in_progress):
+        if in_progress is not None:
             raise SnapmBusyError(
                 f"Snapshot revert is in progress for {name} origin volume {pool_name}/{origin}"
             )
@@ -882,40 +1074,25 @@ class Stratis(Plugin):
         the next activation (typically a reboot into the revert boot entry
         for the snapshot set).
         """
-        (pool_name, fs_name) = name.split("/")
+        (pool_name, _, fs_name) = name.partition("/")
 
-        try:
-            proxy = get_object(TOP_OBJECT)
-            managed_objects = ObjectManager.Methods.GetManagedObjects(proxy, {})
-        except DBusException as err:
-            raise SnapmPluginError(
-                f"Failed to communicate with stratisd: {err}"
-            ) from err
+        index = _get_managed_objects_index()
 
-        (pool_object_path, _) = next(
-            pools(props={"Name": pool_name})
-            .require_unique_match(True)
-            .search(managed_objects)
-        )
-        (fs_object_path, info) = next(
-            filesystems(props={"Name": fs_name, "Pool": pool_object_path})
-            .require_unique_match(True)
-            .search(managed_objects)
-        )
-        filesystem = MOFilesystem(info)
+        (pool_object_path, _) = index.pool(pool_name)
+        (fs_object_path, filesystem) = index.filesystem(pool_object_path, fs_name)
 
         try:
             Filesystem.Properties.MergeScheduled.Set(get_object(fs_object_path), True)
+            _invalidate_managed_objects()
         except DPClientInvocationError as err:
             if isinstance(err.context, DPClientSetPropertyContext):
                 origin_uuid = filesystem.Origin()[1]
-                if len(
-                    _find_in_progress_merge(
-                        managed_objects, pool_object_path, origin_uuid
-                    )
-                ):
+                in_progress = _find_in_progress_merge(
+                    index, pool_object_path, origin_uuid
+                )
+                if in_progress is not None:
                     origin = _origin_uuid_to_fs_name(
-                        managed_objects, pool_object_path, origin_uuid
+                        index, pool_object_path, origin_uuid
                     )
                     raise SnapmBusyError(
                         f"Snapshot revert is in progress for {fs_name} origin volume "
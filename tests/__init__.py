@@ -12,7 +12,10 @@
 # along with this program; if not, write to the Free Software Foundation,
 # Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA
 import os
+from dataclasses import dataclass
 from os.path import abspath, join
+from typing import Optional
+from uuid import UUID
 import time
 
 os.environ["TZ"] = "UTC"
@@ -21,21 +24,22 @@ time.tzset()
 BOOT_ROOT_TEST = join(os.getcwd(), "tests/boot")
 
 
-class MockArgs(object):
-    identifier = None
-    debug = None
-    name = None
-    name_prefixes = False
-    no_headings = False
-    options = ""
-    members = False
-    sort = ""
-    rows = False
-    separator = None
-    uuid = None
-    verbose = 0
-    version = False
-    json = False
+@dataclass
+class MockArgs:
+    identifier: Optional[str] = None
+    debug: Optional[str] = None
+    name: Optional[str] = None
+    name_prefixes: bool = False
+    no_headings: bool = False
+    options: str = ""
+    members: bool = False
+    sort: str = ""
+    rows: bool = False
+    separator: Optional[str] = None
+    uuid: Optional[UUID] = None
+    verbose: int = 0
+    version: bool = False
+    json: bool = False
 
 
 def have_root():
@@ -231,6 +231,44 @@ class BootTests(unittest.TestCase):
         # Clean up boot entries
         self.manager.delete_snapshot_sets(snapm.Selection(name="bootset0"))
 
+    def test_delete_snapshot_sets_second_mounted_keeps_boot_entries(self):
+        snapset_name = "bootset1"
+        snapset_time = 1707923081
+        for origin, mp in self.boot_volumes:
+            self._lvm.create_snapshot(
+                origin,
+                format_snapshot_name(
+                    origin, snapset_name, snapset_time, encode_mount_point(mp)
+                ),
+            )
+        self.manager.discover_snapshot_sets()
+
+        for name in ["bootset0", "bootset1"]:
+            self.manager.create_snapshot_set_boot_entry(name=name)
+            self.manager.create_snapshot_set_revert_entry(name=name)
+
+        sset1 = self.manager.find_snapshot_sets(snapm.Selection(name="bootset1"))[0]
+        mnt_name = sset1.snapshots[0].name.split("/")[1]
+        self._lvm.make_mount_point(mnt_name)
+        self._lvm.mount(mnt_name)
+
+        with self.assertRaises(snapm.SnapmBusyError) as cm:
+            self.manager.delete_snapshot_sets(snapm.Selection())
+
+        self._lvm.umount(mnt_name)
+
+        # Both sets and their boot entries must still exist.
+        self.manager.discover_snapshot_sets()
+        for name in ["bootset0", "bootset1"]:
+            sets = self.manager.find_snapshot_sets(snapm.Selection(name=name))
+            self.assertEqual(len(sets), 1)
+            self.assertIsNotNone(sets[0].boot_entry)
+            self.assertIsNotNone(sets[0].revert_entry)
+
+        # Clean up boot entries
+        self.manager.delete_snapshot_sets(snapm.Selection(name="bootset0"))
+        self.manager.delete_snapshot_sets(snapm.Selection(name="bootset1"))
+
     @unittest.skipIf(not is_redhat(), "profile auto-creation not supported")
     def test_auto_profile_create_boot_entry(self):
         boot_dir = self._populate_boom_root_path()
@@ -14,7 +14,9 @@
 import unittest
 import logging
 import os
+import tempfile
 from uuid import UUID
+from types import SimpleNamespace
 
 
 import snapm
@@ -176,6 +178,10 @@ class ManagerTestsSimple(unittest.TestCase):
         args = ["aname"]
         self._plugin_base_not_implemented_raises("delete_snapshot", args)
 
+    def test_plugin_base_delete_snapshots_raises(self):
+        args = [["aname", "bname"]]
+        self._plugin_base_not_implemented_raises("delete_snapshots", args)
+
     def test_plugin_base_activate_snapshot_raises(self):
         args = ["aname"]
         self._plugin_base_not_implemented_raises("activate_snapshot", args)
@@ -184,6 +190,14 @@ class ManagerTestsSimple(unittest.TestCase):
         args = ["aname"]
         self._plugin_base_not_implemented_raises("deactivate_snapshot", args)
 
+    def test_plugin_base_activate_snapshots_raises(self):
+        args = [["aname", "bname"]]
+        self._plugin_base_not_implemented_raises("activate_snapshots", args)
+
+    def test_plugin_base_deactivate_snapshots_raises(self):
+        args = [["aname", "bname"]]
+        self._plugin_base_not_implemented_raises("deactivate_snapshots", args)
+
     def test_plugin_base_set_autoactivate_raises(self):
         args = ["aname"]
         self._plugin_base_not_implemented_raises("set_autoactivate", args)
@@ -233,6 +247,86 @@ class ManagerTestsSimple(unittest.TestCase):
         paths = [path for path in paths]
         self.assertEqual(sorted(paths), sorted(xpaths))
 
+    def test__journal_in_mounts(self):
+        from snapm.manager._manager import _journal_in_mounts
+
+        cases = [
+            (["/"], True),
+            (["/var"], True),
+            (["/var/log"], True),
+            (["/var/log/journal"], True),
+            (["/var/log/journal/0123456789abcdef"], True),
+            (["/home"], False),
+            (["/var/lib"], False),
+            (["/var/log/journald"], False),
+            ([""], False),
+            (["", ""], False),
+            (["", "/home", "/var"], True),
+            ([], False),
+        ]
+        for mount_points, expected in cases:
+            with self.subTest(mount_points=mount_points):
+                self.assertIs(_journal_in_mounts(mount_points), expected)
+
+    def test__scan_plugin_dir(self):
+        from snapm.manager._manager import _scan_plugin_dir
+
+        names = [
+            "lvm2.py",
+            "Stratis.py",
+            "_plugin.py",
+            "1plugin.py",
+            "\u00e9t\u00e9.py",
+        ]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for name in names + ["notes.txt"]:
+                with open(os.path.join(tmpdir, name), "w", encoding="utf8"):
+                    pass
+            os.mkdir(os.path.join(tmpdir, "subdir.py"))
+            found = sorted(_scan_plugin_dir(tmpdir))
+        self.assertEqual(found, ["Stratis.py", "lvm2.py"])
+
+    def test__find_and_verify_plugins_requested_provider_first(self):
+        class FakePlugin:
+            def __init__(self, name):
+                self.name = name
+                self.probed = []
+
+            def can_snapshot(self, source, st=None):
+                self.probed.append(source)
+                return True
+
+        cases = [
+            (None, "first"),
+            ("first", "first"),
+            ("second", "second"),
+            ("nosuch", "first"),
+        ]
+        for requested, expected in cases:
+            with self.subTest(requested=requested):
+                mgr = manager.Manager.__new__(manager.Manager)
+                mgr.plugins = [FakePlugin("first"), FakePlugin("second")]
+                (provider_map, _) = mgr._find_and_verify_plugins(
+                    ["/"], {"/": None}, requested
+                )
+                self.assertEqual(provider_map["/"].name, expected)
+                probed = [plugin.name for plugin in mgr.plugins if plugin.probed]
+                self.assertEqual(probed, [expected])
+
+    def test__check_deletable_lists_reverting_sets(self):
+        sets = [
+            SimpleNamespace(name=name, status=status, snapshots=[])
+            for (name, status) in [
+                ("testset0", snapm.SnapStatus.REVERTING),
+                ("testset1", snapm.SnapStatus.ACTIVE),
+                ("testset2", snapm.SnapStatus.REVERTING),
+            ]
+        ]
+        with self.assertRaises(snapm.SnapmBusyError) as cm:
+            manager.Manager._check_deletable(sets)
+        self.assertIn("testset0, testset2", str(cm.exception))
+        self.assertNotIn("testset1", str(cm.exception))
+
 
 @unittest.skipIf(not have_root(), "requires root privileges")
 class ManagerTests(unittest.TestCase):
@@ -481,20 +575,75 @@ class ManagerTests(unittest.TestCase):
         self._lvm.umount(mnt_name)
         self.manager.delete_snapshot_sets(s)
 
+    def test_delete_snapshot_sets_second_mounted(self):
+        self.manager.create_snapshot_set("testset0", self.mount_points())
+        sset1 = self.manager.create_snapshot_set("testset1", self.mount_points())
+
+        mnt_name = sset1.snapshots[0].name.split("/")[1]
+        self._lvm.make_mount_point(mnt_name)
+        self._lvm.mount(mnt_name)
+
+        with self.assertRaises(snapm.SnapmBusyError) as cm:
+            self.manager.delete_snapshot_sets(snapm.Selection())
+
+        self._lvm.umount(mnt_name)
+
+        # Neither set may have been touched.
+        self.manager.discover_snapshot_sets()
+        for name in ["testset0", "testset1"]:
+            sets = self.manager.find_snapshot_sets(selection=snapm.Selection(name=name))
+            self.assertEqual(len(sets), 1)
+            self.assertEqual(len(sets[0].snapshots), len(self.mount_points()))
+
+        self.manager.delete_snapshot_sets(snapm.Selection(name="testset0"))
+        self.manager.delete_snapshot_sets(snapm.Selection(name="testset1"))
+
+    def test_delete_snapshot_set_multiple_members(self):
+        sset = self.manager.create_snapshot_set("testset0", self.mount_points())
+        self.assertGreater(len(sset.snapshots), 1)
+        self.manager.delete_snapshot_sets(snapm.Selection(name="testset0"))
+        self.assertEqual(len(sset.snapshots), 0)
+        self.manager.discover_snapshot_sets()
+        self.assertEqual(len(self.manager.find_snapshots()), 0)
+
     def test_delete_err_raises(self):
         sset = self.manager.create_snapshot_set("testset0", self.mount_points())
         selection = snapm.Selection(name="testset0")
 
-        def fail_delete():
-            raise snapm.SnapmError("Error deleting snapshot")
+        def fail_delete(names):
+            raise snapm.SnapmError("Error deleting snapshots")
+
+        provider = sset.snapshots[1].provider
+        provider.delete_snapshots = fail_delete
+
+        with self.assertRaises(snapm.SnapmPluginError) as cm:
+            self.manager.delete_snapshot_sets(selection)
+
+        del provider.delete_snapshots
+        self.assertEqual(len(sset.snapshots), len(self.mount_points()))
+        self.manager.delete_snapshot_sets(selection)
+
+    def test_delete_partial_err_removes_deleted_members(self):
+        sset = self.manager.create_snapshot_set("testset0", self.mount_points())
+        selection = snapm.Selection(name="testset0")
+
+        deleted = sset.snapshots[0]
+        provider = deleted.provider
+        orig_delete_snapshots = provider.delete_snapshots
+
+        def fail_partial_delete(names):
+            orig_delete_snapshots(names[:1])
+            raise snapm.SnapmError("Error deleting snapshots")
 
-        orig_delete = sset.snapshots[1].delete
-        sset.snapshots[1].delete = fail_delete
+        provider.delete_snapshots = fail_partial_delete
 
         with self.assertRaises(snapm.SnapmPluginError) as cm:
             self.manager.delete_snapshot_sets(selection)
 
-        sset.snapshots[0].delete = orig_delete
+        del provider.delete_snapshots
+        self.assertNotIn(deleted, sset.snapshots)
+        self.assertEqual(len(sset.snapshots), len(self.mount_points()) - 1)
+        self.assertEqual(len(self.manager.find_snapshot_sets(selection=selection)), 1)
         self.manager.delete_snapshot_sets(selection)
 
     def test_create_snapshot_set_duplicate(self):
@@ -112,10 +112,14 @@ class PluginTests(unittest.TestCase):
             "-data.3astorage": "/data:storage",
             "-data..storage" : "/data.storage",
         }
-        for enc_mount in enc_mounts.keys():
-            self.assertEqual(
-                plugins.decode_mount_point(enc_mount), enc_mounts[enc_mount]
-            )
+        for enc_mount, mount in enc_mounts.items():
+            with self.subTest(enc_mount=enc_mount):
+                self.assertEqual(plugins.decode_mount_point(enc_mount), mount)
+
+    def test_decode_mount_point_long(self):
+        enc_mount = "-data.3a..storage" * 65536
+        mount = "/data:.storage" * 65536
+        self.assertEqual(plugins.decode_mount_point(enc_mount), mount)
 
     def test_format_snapshot_name(self):
         snapshot_parts = {
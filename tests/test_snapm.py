@@ -14,6 +14,7 @@
 import unittest
 import logging
 from uuid import UUID
+from types import SimpleNamespace
 
 import snapm
 
@@ -37,10 +38,25 @@ FIVE_TIB = 5 * 2**40
 EIGHT_TIB = 8 * 2**40
 TEN_TIB = 10 * 2**40
 
+TEST_UUID_STR = "2a6fd226-b400-577f-afe7-0c1a39c78488"
+TEST_UUID = UUID(TEST_UUID_STR)
+
+# SizePolicy (source, mount, free, used, size) arguments
+GIB_ARGS = ("/", "/", TEN_GIB, FOUR_GIB, TEN_GIB)
+TIB_ARGS = ("/", "/", TEN_TIB, FOUR_TIB, TEN_TIB)
+
 
 class SnapmTests(unittest.TestCase):
     """Test snapm module"""
 
+    @classmethod
+    def setUpClass(cls):
+        # Shared by the tests that only call read-only Selection predicates.
+        cls._sel_null = snapm.Selection()
+        cls._sel_name = snapm.Selection(name="name")
+        cls._sel_uuid = snapm.Selection(uuid=TEST_UUID)
+        cls._sel_origin = snapm.Selection(origin="/dev/fedora/root")
+
     def test_set_debug_mask(self):
         snapm.set_debug_mask(snapm.SNAPM_DEBUG_ALL)
 
@@ -68,24 +84,19 @@ class SnapmTests(unittest.TestCase):
         sl.debug_masked("quux")
 
     def test_Selection_is_null(self):
-        s = snapm.Selection()
-        self.assertTrue(s.is_null())
+        self.assertTrue(self._sel_null.is_null())
 
     def test_Selection_is_single_name(self):
-        s = snapm.Selection(name="name")
-        self.assertTrue(s.is_single())
+        self.assertTrue(self._sel_name.is_single())
 
     def test_Selection_is_single_uuid(self):
-        s = snapm.Selection(uuid=UUID("2a6fd226-b400-577f-afe7-0c1a39c78488"))
-        self.assertTrue(s.is_single())
+        self.assertTrue(self._sel_uuid.is_single())
 
     def test_Selection_is_not_single(self):
-        s = snapm.Selection(origin="/dev/fedora/root")
-        self.assertFalse(s.is_single())
+        self.assertFalse(self._sel_origin.is_single())
 
     def test_Selection_is_not_null(self):
-        s = snapm.Selection(name="name")
-        self.assertFalse(s.is_null())
+        self.assertFalse(self._sel_name.is_null())
 
     def test_Selection_from_cmd_args_identifier_name(self):
         cmd_args = MockArgs()
@@ -95,9 +106,9 @@ class SnapmTests(unittest.TestCase):
 
     def test_Selection_from_cmd_args_identifier_uuid(self):
         cmd_args = MockArgs()
-        cmd_args.identifier = "2a6fd226-b400-577f-afe7-0c1a39c78488"
+        cmd_args.identifier = TEST_UUID_STR
         s = snapm.Selection.from_cmd_args(cmd_args)
-        self.assertEqual(UUID(cmd_args.identifier), s.uuid)
+        self.assertEqual(TEST_UUID, s.uuid)
 
     def test_Selection_from_cmd_args_name(self):
         cmd_args = MockArgs()
@@ -107,7 +118,7 @@ class SnapmTests(unittest.TestCase):
 
     def test_Selection_from_cmd_args_uuid(self):
         cmd_args = MockArgs()
-        cmd_args.uuid = UUID("2a6fd226-b400-577f-afe7-0c1a39c78488")
+        cmd_args.uuid = TEST_UUID
         s = snapm.Selection.from_cmd_args(cmd_args)
         self.assertEqual(cmd_args.uuid, s.uuid)
 
@@ -129,45 +140,50 @@ class SnapmTests(unittest.TestCase):
         with self.assertRaises(ValueError) as cm:
             s.check_valid_selection(snapshot=True)
 
+    def _check_size_policies(self, cases):
+        for args, policy, expected in cases:
+            with self.subTest(policy=policy):
+                self.assertEqual(snapm.SizePolicy(*args, policy).size, expected)
+
     def test_valid_size_policy_fixed(self):
-        policy = snapm.SizePolicy("/", "/", TEN_GIB, FOUR_GIB, TEN_GIB, "2G")
-        self.assertEqual(policy.size, TWO_GIB)
-        policy = snapm.SizePolicy("/", "/", TEN_TIB, FOUR_TIB, TEN_TIB, "2T")
-        self.assertEqual(policy.size, TWO_TIB)
-        policy = snapm.SizePolicy("/", "/", TEN_GIB, FOUR_GIB, TEN_GIB, "2GiB")
-        self.assertEqual(policy.size, TWO_GIB)
-        policy = snapm.SizePolicy("/", "/", TEN_TIB, FOUR_TIB, TEN_TIB, "2TiB")
-        self.assertEqual(policy.size, TWO_TIB)
+        self._check_size_policies(
+            [
+                (GIB_ARGS, "2G", TWO_GIB),
+                (TIB_ARGS, "2T", TWO_TIB),
+                (GIB_ARGS, "2GiB", TWO_GIB),
+                (TIB_ARGS, "2TiB", TWO_TIB),
+            ]
+        )
 
     def test_valid_size_policy_free(self):
-        policy = snapm.SizePolicy("/", "/", TEN_GIB, FOUR_GIB, TEN_GIB, "10%FREE")
-        self.assertEqual(policy.size, ONE_GIB)
-        policy = snapm.SizePolicy("/", "/", TEN_GIB, FOUR_GIB, TEN_GIB, "50%FREE")
-        self.assertEqual(policy.size, FIVE_GIB)
-        policy = snapm.SizePolicy("/", "/", TEN_TIB, FOUR_TIB, TEN_TIB, "80%FREE")
-        self.assertEqual(policy.size, EIGHT_TIB)
-        policy = snapm.SizePolicy("/", "/", TEN_TIB, FOUR_TIB, TEN_TIB, "100%FREE")
-        self.assertEqual(policy.size, TEN_TIB)
+        self._check_size_policies(
+            [
+                (GIB_ARGS, "10%FREE", ONE_GIB),
+                (GIB_ARGS, "50%FREE", FIVE_GIB),
+                (TIB_ARGS, "80%FREE", EIGHT_TIB),
+                (TIB_ARGS, "100%FREE", TEN_TIB),
+            ]
+        )
 
     def test_valid_size_policy_used(self):
-        policy = snapm.SizePolicy("/", "/", TEN_GIB, FOUR_GIB, TEN_GIB, "25%USED")
-        self.assertEqual(policy.size, ONE_GIB)
-        policy = snapm.SizePolicy("/", "/", TEN_GIB, FOUR_GIB, TEN_GIB, "50%USED")
-        self.assertEqual(policy.size, TWO_GIB)
-        policy = snapm.SizePolicy("/", "/", TEN_TIB, FOUR_TIB, TEN_TIB, "100%USED")
-        self.assertEqual(policy.size, FOUR_TIB)
-        policy = snapm.SizePolicy("/", "/", TEN_TIB, FOUR_TIB, TEN_TIB, "200%USED")
-        self.assertEqual(policy.size, EIGHT_TIB)
+        self._check_size_policies(
+            [
+                (GIB_ARGS, "25%USED", ONE_GIB),
+                (GIB_ARGS, "50%USED", TWO_GIB),
+                (TIB_ARGS, "100%USED", FOUR_TIB),
+                (TIB_ARGS, "200%USED", EIGHT_TIB),
+            ]
+        )
 
     def test_valid_size_policy_size(self):
-        policy = snapm.SizePolicy("/", "/", TEN_GIB, FOUR_GIB, TEN_GIB, "20%SIZE")
-        self.assertEqual(policy.size, TWO_GIB)
-        policy = snapm.SizePolicy("/", "/", TEN_GIB, FOUR_GIB, TEN_GIB, "50%SIZE")
-        self.assertEqual(policy.size, FIVE_GIB)
-        policy = snapm.SizePolicy("/", "/", TEN_TIB, FOUR_TIB, TEN_TIB, "80%SIZE")
-        self.assertEqual(policy.size, EIGHT_TIB)
-        policy = snapm.SizePolicy("/", "/", TEN_TIB, FOUR_TIB, TEN_TIB, "100%SIZE")
-        self.assertEqual(policy.size, TEN_TIB)
+        self._check_size_policies(
+            [
+                (GIB_ARGS, "20%SIZE", TWO_GIB),
+                (GIB_ARGS, "50%SIZE", FIVE_GIB),
+                (TIB_ARGS, "80%SIZE", EIGHT_TIB),
+                (TIB_ARGS, "100%SIZE", TEN_TIB),
+            ]
+        )
 
     def test_size_policy_size_over_limit_raises(self):
         with self.assertRaises(snapm.SnapmSizePolicyError) as cm:
@@ -181,14 +197,79 @@ class SnapmTests(unittest.TestCase):
         with self.assertRaises(snapm.SnapmSizePolicyError) as cm:
             policy = snapm.SizePolicy("/", "/", TEN_GIB, FOUR_GIB, TEN_GIB, "100%QUX")
 
-    def test_is_size_policy_valid(self):
-        self.assertEqual(True, snapm.is_size_policy("2G"))
-        self.assertEqual(True, snapm.is_size_policy("100%FREE"))
-        self.assertEqual(True, snapm.is_size_policy("50%USED"))
-        self.assertEqual(True, snapm.is_size_policy("100%SIZE"))
-
-    def test_is_size_policy_invalid(self):
-        self.assertEqual(False, snapm.is_size_policy("2A"))
-        self.assertEqual(False, snapm.is_size_policy("100%QUUX"))
-        self.assertEqual(False, snapm.is_size_policy("foo"))
-        self.assertEqual(False, snapm.is_size_policy("100%"))
+    def test_size_fmt_zero(self):
+        self.assertEqual(snapm.size_fmt(0), "0B")
+
+    def test_size_fmt_units(self):
+        units = ["B", "KiB", "MiB", "GiB", "TiB", "PiB", "EiB", "ZiB", "YiB"]
+        for i, unit in enumerate(units):
+            with self.subTest(unit=unit):
+                self.assertEqual(snapm.size_fmt(1 << (10 * i)), f"1.0{unit}")
+                self.assertEqual(snapm.size_fmt(1023 << (10 * i)), f"1023.0{unit}")
+
+    def test_size_fmt_fraction(self):
+        self.assertEqual(snapm.size_fmt(1536), "1.5KiB")
+
+    def test_size_fmt_yib_limit(self):
+        self.assertEqual(snapm.size_fmt(2048 * 2**80), "2048.0YiB")
+
+    def test_is_size_policy(self):
+        policies = [
+            ("2G", True),
+            ("100%FREE", True),
+            ("50%USED", True),
+            ("100%SIZE", True),
+            ("2A", False),
+            ("100%QUUX", False),
+            ("foo", False),
+            ("100%", False),
+        ]
+        for policy, valid in policies:
+            with self.subTest(policy=policy):
+                self.assertIs(snapm.is_size_policy(policy), valid)
+
+    def test__any_snapshot_mounted(self):
+        from snapm._snapm import _any_snapshot_mounted, _device_id
+
+        active = SimpleNamespace(status=snapm.SnapStatus.ACTIVE, devpath="/")
+        inactive = SimpleNamespace(status=snapm.SnapStatus.INACTIVE, devpath="/")
+        mounted_ids = {_device_id("/")}
+        cases = [
+            ([active], mounted_ids, True),
+            ([inactive, active], mounted_ids, True),
+            ([inactive], mounted_ids, False),
+            ([active], set(), False),
+            ([], mounted_ids, False),
+        ]
+        for snapshots, device_ids, mounted in cases:
+            with self.subTest(snapshots=snapshots, device_ids=device_ids):
+                self.assertIs(_any_snapshot_mounted(snapshots, device_ids), mounted)
+
+    def test_snapshot_set_set_autoactivate_skips_unchanged(self):
+        class FakeSnapshot:
+            def __init__(self, name, cached_autoactivate):
+                self.name = name
+                self.mount_point = f"/{name}"
+                self.origin = f"vg/{name}"
+                self.cached_autoactivate = cached_autoactivate
+                self.calls = []
+
+            def set_autoactivate(self, auto=False):
+                self.calls.append(auto)
+
+        cases = [
+            ([True, True], False),
+            ([True, None], True),
+            ([False, True], True),
+            ([None, None], True),
+        ]
+        for cached, changed in cases:
+            with self.subTest(cached=cached):
+                snapshots = [
+                    FakeSnapshot(f"lv{i}", value) for (i, value) in enumerate(cached)
+                ]
+                snapset = snapm.SnapshotSet("testset0", 1693921253, snapshots)
+                self.assertIs(snapset.set_autoactivate(auto=True), changed)
+                for snapshot in snapshots:
+                    expected = [] if snapshot.cached_autoactivate is True else [True]
+                    self.assertEqual(snapshot.calls, expected)
@@ -18,7 +18,6 @@ import psutil
 import os
 from subprocess import run
 
-from dbus_client_gen import DbusClientUniqueResultError
 
 log = logging.getLogger()
 log.level = logging.DEBUG
@@ -135,31 +134,35 @@ class StratisTests(unittest.TestCase):
     def test__get_pool_filesystem(self):
         proxy = get_object(TOP_OBJECT)
         managed_objects = ObjectManager.Methods.GetManagedObjects(proxy, {})
+        index = stratis._ManagedObjectsIndex(managed_objects)
 
-        (pool, filesystem) = stratis._get_pool_filesystem(managed_objects, "pool1", "fs1")
+        (pool, filesystem) = stratis._get_pool_filesystem(index, "pool1", "fs1")
         self.assertTrue(str(pool.Name()) == "pool1")
         self.assertTrue(str(filesystem.Name()) == "fs1")
 
     def test__get_pool_filesystem_bad_pool(self):
         proxy = get_object(TOP_OBJECT)
         managed_objects = ObjectManager.Methods.GetManagedObjects(proxy, {})
+        index = stratis._ManagedObjectsIndex(managed_objects)
 
-        with self.assertRaises(DbusClientUniqueResultError) as cm:
-            (pool, filesystem) = stratis._get_pool_filesystem(managed_objects, "nosuchpool1", "fs1")
+        with self.assertRaises(SnapmNotFoundError) as cm:
+            (pool, filesystem) = stratis._get_pool_filesystem(index, "nosuchpool1", "fs1")
 
     def test__get_pool_filesystem_bad_fs(self):
         proxy = get_object(TOP_OBJECT)
         managed_objects = ObjectManager.Methods.GetManagedObjects(proxy, {})
+        index = stratis._ManagedObjectsIndex(managed_objects)
 
-        with self.assertRaises(DbusClientUniqueResultError) as cm:
-            (pool, filesystem) = stratis._get_pool_filesystem(managed_objects, "pool1", "nosuchfs1")
+        with self.assertRaises(SnapmNotFoundError) as cm:
+            (pool, filesystem) = stratis._get_pool_filesystem(index, "pool1", "nosuchfs1")
 
     def test_pool_free_space_bytes(self):
         proxy = get_object(TOP_OBJECT)
         managed_objects = ObjectManager.Methods.GetManagedObjects(proxy, {})
+        index = stratis._ManagedObjectsIndex(managed_objects)
 
-        (pool, filesystem) = stratis._get_pool_filesystem(managed_objects, "pool1", "fs1")
-        free_bytes = stratis._pool_free_space_bytes(managed_objects, "pool1")
+        (pool, filesystem) = stratis._get_pool_filesystem(index, "pool1", "fs1")
+        free_bytes = stratis._pool_free_space_bytes(index, "pool1")
         self.assertEqual(
             int(pool.TotalPhysicalSize()) - int(pool.TotalPhysicalUsed()[1]) if pool.TotalPhysicalUsed()[0] else 0,
             free_bytes
@@ -168,8 +171,9 @@ class StratisTests(unittest.TestCase):
     def test_fs_size_bytes(self):
         proxy = get_object(TOP_OBJECT)
         managed_objects = ObjectManager.Methods.GetManagedObjects(proxy, {})
+        index = stratis._ManagedObjectsIndex(managed_objects)
 
-        size_bytes = stratis._fs_size_bytes(managed_objects, "pool1", "fs1")
+        size_bytes = stratis._fs_size_bytes(index, "pool1", "fs1")
         self.assertEqual(size_bytes, 2**30)
 
     def test_pool_fs_from_device_path(self):
@@ -200,13 +204,15 @@ class StratisTests(unittest.TestCase):
 
         proxy = get_object(TOP_OBJECT)
         managed_objects = ObjectManager.Methods.GetManagedObjects(proxy, {})
+        index = stratis._ManagedObjectsIndex(managed_objects)
 
-        (pool, fs) = stratis._get_pool_filesystem(managed_objects, "pool1", "fs1-snapset_test_1721136677_-opt")
+        (pool, fs) = stratis._get_pool_filesystem(index, "pool1", "fs1-snapset_test_1721136677_-opt")
 
         managed_objects = ObjectManager.Methods.GetManagedObjects(proxy, {})
+        index = stratis._ManagedObjectsIndex(managed_objects)
 
         origin = stratis._origin_uuid_to_fs_name(
-            managed_objects, fs.Pool(), str(fs.Origin()[1])
+            index, fs.Pool(), str(fs.Origin()[1])
         )
 
         self.assertEqual(origin, "fs1")
@@ -216,13 +222,15 @@ class StratisTests(unittest.TestCase):
 
         proxy = get_object(TOP_OBJECT)
         managed_objects = ObjectManager.Methods.GetManagedObjects(proxy, {})
+        index = stratis._ManagedObjectsIndex(managed_objects)
 
-        (pool, fs) = stratis._get_pool_filesystem(managed_objects, "pool1", "fs1-snapset_test_1721136677_-opt")
+        (pool, fs) = stratis._get_pool_filesystem(index, "pool1", "fs1-snapset_test_1721136677_-opt")
         self.assertEqual(True, stratis.filter_stratis_snapshot(fs))
 
     def test_filter_stratis_snapshot_nonsnapshot(self):
         proxy = get_object(TOP_OBJECT)
         managed_objects = ObjectManager.Methods.GetManagedObjects(proxy, {})
+        index = stratis._ManagedObjectsIndex(managed_objects)
 
-        (pool, fs) = stratis._get_pool_filesystem(managed_objects, "pool1", "fs1")
+        (pool, fs) = stratis._get_pool_filesystem(index, "pool1", "fs1")
         self.assertEqual(False, stratis.filter_stratis_snapshot(fs))